@@ -1,7 +1,8 @@
 import numpy as np
 import pandas as pd
-from djutils import keys, merge, unique, rowproperty, rowmethod
+from djutils import keys, merge, unique, rowproperty, rowmethod, MissingError
 from foundation.utils import tqdm
+from foundation.utils.prefetch import fetch_lock, locked_fetch
 from foundation.virtual import stimulus, recording, fnn
 
 
@@ -13,6 +14,9 @@ from foundation.virtual import stimulus, recording, fnn
 class DataType:
     """Data"""
 
+    # whether the dataset is stored in the local dataset cache (foundation.utils.cache)
+    cacheable = False
+
     @rowproperty
     def stimuli(self):
         """
@@ -210,6 +214,8 @@ class RecordingType(DataType):
 class _VisualScan(VisualType, RecordingType):
     """Visual Scan Data -- Base"""
 
+    cacheable = True
+
     @property
     def unit_set(self):
         raise NotImplementedError()
@@ -224,7 +230,7 @@ class _VisualScan(VisualType, RecordingType):
 
     def _key_traces(self, datatype):
         keymap = {f"{_}_id": f"{_}_id_{datatype}" for _ in ["resample", "offset", "standardize"]}
-        return (recording.ScanTrials * fnn.Spec.VisualSpec).proj("rate_id", "trialset_id", **keymap)
+        return (recording.ScanTrials * fnn.Spec.VisualSpec).proj("rate_id", "codec_id", "trialset_id", **keymap)
 
     @rowproperty
     def key_perspective(self):
@@ -293,47 +299,140 @@ class _VisualScan(VisualType, RecordingType):
     def trialset_id(self):
         return (recording.ScanRecording & self.item).fetch1("trialset_id")
 
+    def _stimuli_loader(self):
+        with fetch_lock:
+            key = self.key_video
+            rows = stimulus.ResizedVideo * recording.TrialVideo * recording.ResampledTrial
+
+        def load(trial_ids):
+            for trial_id in trial_ids:
+                (video,), (index,) = locked_fetch(rows & key & {"trial_id": trial_id}, "video", "index")
+                yield video[index].astype(np.uint8)
+
+        return load
+
     @rowmethod
     def trial_stimuli(self, trial_ids):
-        key = self.key_video
-        rows = stimulus.ResizedVideo * recording.TrialVideo * recording.ResampledTrial
+        return self._stimuli_loader()(trial_ids)
 
-        # load trials
-        for trial_id in trial_ids:
-            video, index = (rows & key & {"trial_id": trial_id}).fetch1("video", "index")
-            yield video[index].astype(np.uint8)
-
-    def _trial_traces(self, trial_ids, datatype):
+    def _traces_loader(self, datatype):
         from foundation.recording.trace import TraceSet
         from foundation.recording.compute.standardize import StandardizedTraces
+        from foundation.utility.codec import Codec
+        from foundation.recording.compute.trace import matrix_file
+        from foundation.utils.codec import decode, dequantize
+        from foundation.utils import npy
 
-        if datatype == "perspective":
-            key = self.key_perspective
-            order = recording.ScanVisualPerspectiveOrder
+        with fetch_lock:
 
-        elif datatype == "modulation":
-            key = self.key_modulation
-            order = recording.ScanVisualModulationOrder
+            if datatype == "perspective":
+                key = self.key_perspective
+                order = recording.ScanVisualPerspectiveOrder
 
-        elif datatype == "unit":
-            key = self.key_unit
-            order = self.unit_order
+            elif datatype == "modulation":
+                key = self.key_modulation
+                order = recording.ScanVisualModulationOrder
 
-        else:
-            raise ValueError(f"datatype `{datatype}` not recognized")
+            elif datatype == "unit":
+                key = self.key_unit
+                order = self.unit_order
+
+            else:
+                raise ValueError(f"datatype `{datatype}` not recognized")
+
+            # number of traces
+            traces = (TraceSet & key).fetch1("members")
+
+            # trace order
+            order = merge((TraceSet & key).members, order & key)
+            order = order.fetch("traceset_index", order_by="trace_order")
+
+            # trace standardization, fused with trace order
+            transform = (StandardizedTraces & key).transform.reorder(order)
+
+            # trace set matrix, written for all trials of the scan recording
+            trialset_id = (recording.ScanRecording & self.item).fetch1("trialset_id")
+            matrix = recording.ResampledTracesMatrix & dict(key, trialset_id=trialset_id)
+
+            if matrix:
+                codec, _ = (Codec & key).link.encoding
+                paths = matrix_file(matrix), matrix_file(matrix, "affine")
+                matrices = (recording.ResampledTracesMatrix.Index & matrix).fetch(
+                    "trial_id", "matrix_start", "matrix_end", "matrix_trial"
+                )
+                matrices = {t: m for t, *m in zip(*matrices)}
+            else:
+                matrices = dict()
+
+        files = []
+
+        def matrix_trial(start, end, trial, out):
+            # memory-mapped matrix and affine parameters
+            if not files:
+                files.extend(None if path is None else npy.load(path) for path in paths)
+
+            matrix, affine = files
+
+            if affine is None:
+                return dequantize(matrix[start:end], codec, out=out)
+            else:
+                offset, scale = affine[trial]
+                return dequantize(matrix[start:end], codec, offset=offset, scale=scale, out=out)
+
+        def length(trial_id, fetched):
+            if trial_id in matrices:
+                start, end, _ = matrices[trial_id]
+                return end - start
+            else:
+                payload = fetched[trial_id]
+                return payload["shape"][0] if isinstance(payload, dict) else len(payload)
+
+        def load(trial_ids, batch_size=64):
+            # decoded traces of a batch, reused across batches
+            buffer = np.empty([0, traces], dtype=np.float32)
+
+            # load trials in batches
+            trial_ids = list(trial_ids)
+
+            for i in range(0, len(trial_ids), batch_size):
+
+                batch = trial_ids[i : i + batch_size]
+
+                # trials without a trace set matrix, fetched in a single query
+                fetched = [{"trial_id": t} for t in batch if t not in matrices]
 
-        # trace standardization
-        transform = (StandardizedTraces & key).transform
+                if fetched:
+                    fetched = dict(zip(*locked_fetch(recording.ResampledTraces & key & fetched, "trial_id", "traces")))
+                else:
+                    fetched = dict()
 
-        # trace order
-        order = merge((TraceSet & key).members, order & key)
-        order = order.fetch("traceset_index", order_by="trace_order")
+                missing = [t for t in batch if t not in matrices and t not in fetched]
+                if missing:
+                    raise MissingError(f"Trial_ids {missing} have neither a trace set matrix nor resampled traces")
 
-        # load trials
-        for trial_id in trial_ids:
+                # trial bounds in the batch buffer
+                bounds = np.cumsum([0] + [length(t, fetched) for t in batch])
 
-            traces = (recording.ResampledTraces & key & {"trial_id": trial_id}).fetch1("traces")
-            yield transform(traces).astype(np.float32)[:, order]
+                if len(buffer) < bounds[-1]:
+                    buffer = np.empty([bounds[-1], traces], dtype=np.float32)
+
+                # decode the batch, in the requested trial order
+                for trial_id, start, end in zip(batch, bounds[:-1], bounds[1:]):
+
+                    if trial_id in matrices:
+                        # contiguous slice of the trace set matrix
+                        matrix_trial(*matrices[trial_id], out=buffer[start:end])
+                    else:
+                        decode(fetched[trial_id], out=buffer[start:end])
+
+                # standardize and reorder each trial into its own array
+                for start, end in zip(bounds[:-1], bounds[1:]):
+                    yield transform(buffer[start:end], out=np.empty([end - start, order.size], dtype=np.float32))
+
+        return load
+
+    def _trial_traces(self, trial_ids, datatype, batch_size=64):
+        return self._traces_loader(datatype)(trial_ids, batch_size=batch_size)
 
     @rowmethod
     def trial_perspectives(self, trial_ids):
@@ -350,10 +449,7 @@ class _VisualScan(VisualType, RecordingType):
         # unit trace(s)
         return self._trial_traces(trial_ids, "unit")
 
-    @rowproperty
-    def dataset(self):
-        from fnn.data import NpyFile, Dataset
-
+    def _dataset_trials(self):
         # tiers
         training_tier, validation_tier = self.key.fetch1("training_tier", "validation_tier")
         tier_keys = [{"tier_index": index} for index in [training_tier, validation_tier]]
@@ -367,33 +463,103 @@ class _VisualScan(VisualType, RecordingType):
         )
         trial_ids, tiers, samples = trials.fetch("trial_id", "tier_index", "samples", order_by="start")
 
-        # load trials
-        stimuli, perspectives, modulations, units = [], [], [], []
+        # trial index and scalar columns
+        index = pd.Index(trial_ids, name="trial_id")
+        columns = {"training": tiers == training_tier, "samples": samples}
 
-        for s, p, m, u in zip(
-            self.trial_stimuli(tqdm(trial_ids, desc="Trials")),
-            self.trial_perspectives(trial_ids),
-            self.trial_modulations(trial_ids),
-            self.trial_units(trial_ids),
-        ):
+        return index, columns
 
-            stimuli.append(NpyFile(s))
-            perspectives.append(NpyFile(p))
-            modulations.append(NpyFile(m))
-            units.append(NpyFile(u))
+    def _dataset_streams(self, trial_ids, transform=None):
+        from foundation.utils.prefetch import prefetch, prefetch_size
 
-        assert len(stimuli) == len(trial_ids)
-
-        # dataset
-        data = {
-            "training": tiers == training_tier,
-            "samples": samples,
-            "stimuli": stimuli,
-            "perspectives": perspectives,
-            "modulations": modulations,
-            "units": units,
+        # trial streams
+        streams = {
+            "stimuli": self.trial_stimuli(trial_ids),
+            "perspectives": self.trial_perspectives(trial_ids),
+            "modulations": self.trial_modulations(trial_ids),
+            "units": self.trial_units(trial_ids),
         }
-        data = pd.DataFrame(data, index=pd.Index(trial_ids, name="trial_id"))
+        if transform is not None:
+            streams = {k: map(transform, v) for k, v in streams.items()}
+
+        # prefetch streams concurrently
+        size = prefetch_size()
+        if size > 0:
+            streams = {k: prefetch(v, size=size) for k, v in streams.items()}
+
+        return streams
+
+    @rowproperty
+    def dataset(self):
+        from fnn.data import NpyFile, Dataset
+        from datajoint.hash import key_hash
+        from foundation.utils.cache import DatasetCache, dataset_cache
+        from foundation.utils.lazy import TrialLoader, lazy_size
+        from foundation.utils.prefetch import prefetch_size
+
+        # local dataset cache
+        root = dataset_cache()
+
+        if root is None and lazy_size() > 0:
+
+            # trials
+            index, columns = self._dataset_trials()
+
+            # trial loaders, loading trials on demand -- loader, sample shape, dtype
+            loaders = {
+                "stimuli": (self._stimuli_loader(), [*self.resolution, self.stimuli], np.uint8),
+                "perspectives": (self._traces_loader("perspective"), [self.perspectives], np.float32),
+                "modulations": (self._traces_loader("modulation"), [self.modulations], np.float32),
+                "units": (self._traces_loader("unit"), [self.units], np.float32),
+            }
+            loaders = {
+                k: TrialLoader(load, keys=index, shape=shape, dtype=dtype, size=lazy_size(), prefetch=prefetch_size())
+                for k, (load, shape, dtype) in loaders.items()
+            }
+
+            # dataset
+            trials = {k: v.handles(columns["samples"]) for k, v in loaders.items()}
+            data = pd.DataFrame(dict(columns, **trials), index=index)
+
+        elif root is None:
+
+            # trials
+            index, columns = self._dataset_trials()
+
+            # load trials
+            streams = self._dataset_streams(index, transform=NpyFile)
+            trials = {k: [] for k in streams}
+
+            for arrays in zip(*streams.values(), tqdm(index, desc="Trials")):
+                for k, array in zip(trials, arrays):
+                    trials[k].append(array)
+
+            assert all(len(v) == len(index) for v in trials.values())
+
+            # dataset
+            data = pd.DataFrame(dict(columns, **trials), index=index)
+
+        else:
+            # cache keyed by the data type and a hash of its key
+            cache = DatasetCache(root, name=f"{type(self).__name__}_{key_hash(self.key.fetch1())}")
+
+            with cache.lock():
+
+                if not cache.exists:
+
+                    # trials
+                    index, columns = self._dataset_trials()
+
+                    # write trials to the cache
+                    streams = self._dataset_streams(index)
+                    streams["stimuli"] = tqdm(streams["stimuli"], total=len(index), desc="Trials")
+                    cache.write(index, columns, streams)
+
+            # dataset, with trial arrays memory-mapped from the cache
+            data = cache.read()
+            for column in ["stimuli", "perspectives", "modulations", "units"]:
+                data[column] = data[column].map(NpyFile)
+
         return Dataset(data)
 
 
@@ -447,10 +613,243 @@ class Sensorium2023(DataType):
 
     @rowproperty
     def root(self):
+        """
+        Returns
+        -------
+        str
+            dataset directory -- the parent directory can be set with the FOUNDATION_SENSORIUM environment variable
+        """
+        import os
+
+        root = os.getenv("FOUNDATION_SENSORIUM", os.path.join("/mnt", "scratch09", "sensorium_2023"))
+        return os.path.join(root, self.item["sensorium_dataset"])
+
+    @staticmethod
+    def _samples(x):
+        # number of samples before the NaN padding, which must be trailing and contiguous along the first axis
+        finite = np.isfinite(x).reshape(len(x), -1).all(axis=1)
+        samples = len(finite) if finite.all() else int(np.argmin(finite))
+
+        if finite[samples:].any():
+            raise ValueError("NaN padding is not trailing and contiguous")
+
+        return samples
+
+    @staticmethod
+    def _load(root, datatype, trial_id, samples=None):
         from os.path import join
 
-        return join("/mnt", "scratch09", "sensorium_2023", self.item["sensorium_dataset"])
+        # memory-mapped trial array -- [features, (...), frames]
+        x = np.load(join(root, "data", datatype, f"{trial_id}.npy"), mmap_mode="r")
+
+        # samples along the first axis
+        x = np.moveaxis(x, -1, 0)
+
+        if samples is None:
+            return x
+        else:
+            return x[:samples]
+
+    @rowproperty
+    def trial_ids(self):
+        """
+        Returns
+        -------
+        Tuple[str]
+            training & validation trial ids
+        """
+        from os.path import join
+
+        tiers = np.load(join(self.root, "meta", "trials", "tiers.npy"))
+        trainval = [_.strip() for _ in self.item["trainval_tiers"].split(",")]
+
+        return tuple(str(_) for _ in np.flatnonzero(np.isin(tiers, trainval)))
+
+    @rowproperty
+    def trial_samples(self):
+        """
+        Returns
+        -------
+        1D array
+            [trials] -- number of samples per trial, without NaN padding
+        """
+        # unpadded behavior samples
+        root = self.root
+        return np.array([self._samples(self._load(root, "behavior", t)) for t in self.trial_ids])
+
+    @rowproperty
+    def training(self):
+        """
+        Returns
+        -------
+        1D array
+            [trials] -- dtype=bool -- training | validation trial
+        """
+        # ordered trial ids
+        trial_ids = sorted(self.trial_ids, key=int)
+
+        # random split
+        rng = np.random.default_rng(self.item["split_seed"])
+        size = round(len(trial_ids) * float(self.item["split_fraction"]))
+        training = set(rng.choice(trial_ids, size=size, replace=False))
+
+        return np.array([t in training for t in self.trial_ids])
+
+    @rowproperty
+    def stimuli(self):
+        return 1
+
+    @rowproperty
+    def perspectives(self):
+        return self._load(self.root, "pupil_center", self.trial_ids[0]).shape[1]
+
+    @rowproperty
+    def modulations(self):
+        return self._load(self.root, "behavior", self.trial_ids[0]).shape[1]
+
+    @rowproperty
+    def units(self):
+        return self._load(self.root, "responses", self.trial_ids[0]).shape[1]
+
+    @rowproperty
+    def perspective_offset(self):
+        return 0.0
+
+    @rowproperty
+    def modulation_offset(self):
+        return 0.0
+
+    @rowproperty
+    def unit_offset(self):
+        return 0.0
 
-    def trim(self, x, axis):
-        end = np.where(np.isnan(x))[axis].min()
-        return np.take(x, np.arange(end), axis=axis)
+    @rowproperty
+    def sampling_period(self):
+        return 1 / 30
+
+    @rowproperty
+    def resolution(self):
+        """
+        Returns
+        -------
+        int
+            height (pixels)
+        int
+            width (pixels)
+        """
+        return self._load(self.root, "videos", self.trial_ids[0]).shape[1:3]
+
+    @rowproperty
+    def dataset(self):
+        from fnn.data import Dataset
+        from foundation.utils.lazy import TrialLoader
+        from foundation.utils.prefetch import prefetch_size
+
+        # dataset directory and trials, resolved once -- trials are loaded by background threads
+        root = self.root
+        trial_ids = self.trial_ids
+        samples = dict(zip(trial_ids, self.trial_samples))
+        index = pd.Index(trial_ids, name="trial_id")
+
+        # memory-mapped trial views, trimmed on access
+        def loader(datatype, transform=None):
+            def load(trial_ids):
+                for trial_id in trial_ids:
+                    x = self._load(root, datatype, trial_id)
+                    n = samples[trial_id]
+
+                    # verify that the data type matches the behavior samples of the trial
+                    if self._samples(x) != n:
+                        raise ValueError(f"`{datatype}` of trial_id `{trial_id}` does not have {n} unpadded samples")
+
+                    yield x[:n] if transform is None else transform(x[:n])
+
+            # sample shape and dtype, from the first trial
+            x = self._load(root, datatype, trial_ids[0], samples=0)
+            x = x if transform is None else transform(x)
+
+            return TrialLoader(
+                load, keys=index, shape=x.shape[1:], dtype=x.dtype, size=len(index), prefetch=prefetch_size()
+            )
+
+        loaders = {
+            "stimuli": loader("videos", transform=lambda x: x.astype(np.uint8)[..., None]),
+            "perspectives": loader("pupil_center"),
+            "modulations": loader("behavior"),
+            "units": loader("responses"),
+        }
+
+        # dataset
+        lengths = [samples[t] for t in trial_ids]
+        data = {"training": self.training, "samples": lengths}
+        data.update({k: v.handles(lengths) for k, v in loaders.items()})
+        data = pd.DataFrame(data, index=index)
+        return Dataset(data)
+
+
+@keys
+class Synthetic(DataType):
+    """Synthetic Data"""
+
+    @property
+    def keys(self):
+        return [
+            fnn.Synthetic,
+        ]
+
+    @rowproperty
+    def stimuli(self):
+        return self.item["channels"]
+
+    @rowproperty
+    def perspectives(self):
+        return self.item["perspectives"]
+
+    @rowproperty
+    def modulations(self):
+        return self.item["modulations"]
+
+    @rowproperty
+    def units(self):
+        return self.item["units"]
+
+    @rowproperty
+    def perspective_offset(self):
+        return 0.0
+
+    @rowproperty
+    def modulation_offset(self):
+        return 0.0
+
+    @rowproperty
+    def unit_offset(self):
+        return 0.0
+
+    @rowproperty
+    def sampling_period(self):
+        return 1 / 30
+
+    @rowproperty
+    def resolution(self):
+        """
+        Returns
+        -------
+        int
+            height (pixels)
+        int
+            width (pixels)
+        """
+        return self.item["height"], self.item["width"]
+
+    @rowproperty
+    def dataset(self):
+        from foundation.utils.synthetic import dataset
+        from foundation.utils.lazy import lazy_size
+
+        keys = ["trials", "samples", "height", "width", "channels", "perspectives", "modulations", "units", "seed"]
+
+        return dataset(
+            training_fraction=float(self.item["training_fraction"]),
+            lazy=lazy_size(),
+            **{k: self.item[k] for k in keys},
+        )
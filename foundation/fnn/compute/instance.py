@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from djutils import keys, rowmethod, rowproperty
 from foundation.utils import logger
 from foundation.virtual import fnn
@@ -57,8 +58,77 @@ class ParallelCycle(InstanceType):
         """
         return
 
+    def _build_datasets(self, data_ids):
+        """Builds datasets into the local dataset cache, so that ranks attach to them instead of rebuilding them
+
+        Parameters
+        ----------
+        data_ids : Iterable[str]
+            keys (foundation.fnn.data.Data)
+        """
+        from foundation.fnn.data import Data
+
+        for data_id in data_ids:
+
+            data = (Data & {"data_id": data_id}).link.compute
+
+            if data.cacheable:
+                logger.info(f"Building dataset for data_id `{data_id}`")
+                data.dataset
+
+    @staticmethod
+    @contextmanager
+    def _device(rank, size):
+        """Context manager that places a distributed rank on a cuda device, or on cpu if cpu usage is enabled
+
+        Parameters
+        ----------
+        rank : int
+            distributed rank
+        size : int
+            distributed size
+
+        Yields
+        ------
+        str
+            'cuda' | 'cpu' -- torch device
+        str
+            'nccl' | 'gloo' -- distributed backend
+        """
+        from foundation.utils import cpu_enabled, cpu_threads
+
+        if cpu_enabled():
+            from torch import set_num_threads
+
+            # torch threads per rank
+            set_num_threads(cpu_threads(processes=size))
+
+            yield "cpu", "gloo"
+
+        else:
+            from torch.cuda import device
+
+            with device(rank):
+                yield "cuda", "nccl"
+
+    @staticmethod
+    def _verify_devices(size):
+        """
+        Parameters
+        ----------
+        size : int
+            distributed size
+        """
+        from torch.cuda import device_count
+        from foundation.utils import cpu_enabled
+
+        if cpu_enabled():
+            logger.info(f"Instantiating on cpu with {size} processes")
+        else:
+            assert device_count() >= size, "Insufficient cuda devices"
+
     @rowmethod
-    def _instantiate(self, data_id, network_id, main=False):
+    def _instantiate(self, data_id, network_id, main=False, device="cuda"):
         """
         Parameters
         ----------
@@ -68,6 +138,8 @@ class ParallelCycle(InstanceType):
             key (foundation.fnn.data.Data)
         main : bool
             main rank
+        device : str
+            'cuda' | 'cpu' -- torch device
         """
         from foundation.fnn.progress import ModelInfo, ModelCheckpoint, ModelLag, ModelDone
         from foundation.fnn.transfer import Transfer, TransferList
@@ -76,7 +148,6 @@ class ParallelCycle(InstanceType):
         from foundation.fnn.train import Train
         from foundation.fnn.data import Data
         from foundation.utils import torch_rng
-        from torch import device
 
         # key
         instance_id = (self.instance_type & self.item).fetch1("instance_id")
@@ -87,7 +158,7 @@ class ParallelCycle(InstanceType):
             logger.info(f"Initializing parameters with random seed {self.item['seed']}")
 
             # initial network
-            network = (Network & {"network_id": network_id}).link.network(data_id=data_id).to(device="cuda")
+            network = (Network & {"network_id": network_id}).link.network(data_id=data_id).to(device=device)
 
             # transfer network
             if (TransferList & self.item).fetch1("members"):
@@ -112,11 +183,11 @@ class ParallelCycle(InstanceType):
             logger.info("Reloading from checkpoint")
 
             # reload parameters
-            parameters = (ModelCheckpoint & key).parameters(device="cuda")
+            parameters = (ModelCheckpoint & key).parameters(device=device)
             network.load_state_dict(parameters)
 
             # reload checkpoint
-            checkpoint = (ModelCheckpoint & key).checkpoint(device="cuda")
+            checkpoint = (ModelCheckpoint & key).checkpoint(device=device)
 
         elif self.item["cycle"]:
             logger.info("Reloading from previous cycle")
@@ -128,7 +199,7 @@ class ParallelCycle(InstanceType):
             prev = {"data_id": data_id, "network_id": network_id, "instance_id": prev}
 
             # reload parameters
-            parameters = (Model & prev).parameters(device="cuda")
+            parameters = (Model & prev).parameters(device=device)
             network.load_state_dict(parameters)
 
             # no checkpoint
@@ -187,7 +258,7 @@ class Individual(ParallelCycle):
         return fnn.Instance.Individual
 
     @staticmethod
-    def _spawn(rank, size, data_id, network_id, instance_id, port=23456, backend="nccl"):
+    def _spawn(rank, size, data_id, network_id, instance_id, init_method, timeout=1800, backend=None):
         """
         Parameters
         ----------
@@ -201,60 +272,62 @@ class Individual(ParallelCycle):
             key (foundation.fnn.network.Network)
         instance_id : str
             key (foundation.fnn.instance.Instance)
-        port : int
-            tcp port
-        backend : str
-            'nccl' | 'mpi' | 'gloo' | 'ucc'
+        init_method : str
+            init method of the process group (foundation.utils.distributed.rendezvous)
+        timeout : int
+            timeout (seconds) of process group operations
+        backend : str | None
+            'nccl' | 'mpi' | 'gloo' | 'ucc' | None -- None selects 'nccl' on cuda and 'gloo' on cpu
         """
-        from torch.cuda import device
-        from torch.distributed import init_process_group
+        from foundation.utils.distributed import process_group
 
         # main rank
         main = rank == 0
 
-        # cuda device
-        with device(rank):
+        # rank device
+        with ParallelCycle._device(rank, size) as (device, default_backend):
 
-            # distributed process group
-            init_process_group(
-                backend=backend,
-                init_method=f"tcp://0.0.0.0:{port}",
-                rank=rank,
-                world_size=size,
-            )
+            # distributed process group, destroyed on exit
+            with process_group(rank, size, init_method, backend=backend or default_backend, timeout=timeout):
 
-            # model instance
-            key = fnn.Instance.Individual & {"instance_id": instance_id}
-            instance = Individual & key
+                # model instance
+                key = fnn.Instance.Individual & {"instance_id": instance_id}
+                instance = Individual & key
 
-            # instantiate model
-            instance._instantiate(data_id=data_id, network_id=network_id, main=main)
+                # instantiate model
+                instance._instantiate(data_id=data_id, network_id=network_id, main=main, device=device)
 
     @rowmethod
     def instantiate(self, data_id, network_id):
-        from random import randint
-        from torch.cuda import device_count
         from torch.multiprocessing import spawn
-
-        # tcp port
-        port = randint(10000, 60000)
+        from foundation.utils.distributed import rendezvous, rendezvous_timeout
+        from foundation.utils.cache import shared_dataset_cache
 
         # parallel group size, instance_id
         parallel, instance_id = (fnn.Instance.Individual & self.item).fetch1("parallel", "instance_id")
 
-        # verify cuda devices
-        assert device_count() >= parallel, "Insufficient cuda devices"
-
-        # instantiate with multiprocessing
-        conn = self.key.connection
-        conn.close()
-        spawn(
-            Individual._spawn,
-            args=(parallel, data_id, network_id, instance_id, port),
-            nprocs=parallel,
-            join=True,
-        )
-        conn.connect()
+        # verify devices
+        self._verify_devices(parallel)
+
+        with shared_dataset_cache() as root:
+
+            # build dataset once, shared by all ranks, if a dataset cache is used
+            if root is not None:
+                self._build_datasets([data_id])
+
+            # instantiate with multiprocessing, ranks meet at a rendezvous unique to this spawn
+            conn = self.key.connection
+            conn.close()
+            try:
+                with rendezvous() as init_method:
+                    spawn(
+                        Individual._spawn,
+                        args=(parallel, data_id, network_id, instance_id, init_method, rendezvous_timeout()),
+                        nprocs=parallel,
+                        join=True,
+                    )
+            finally:
+                conn.connect()
 
         # yield model
         yield data_id, network_id
@@ -285,7 +358,7 @@ class Foundation(ParallelCycle):
         return modules.fetch("module", order_by="moduleset_index").tolist()
 
     @staticmethod
-    def _spawn(rank, size, data_ids, network_id, instance_id, port=23456, backend="nccl"):
+    def _spawn(rank, size, data_ids, network_id, instance_id, init_method, timeout=1800, backend=None):
         """
         Parameters
         ----------
@@ -299,47 +372,40 @@ class Foundation(ParallelCycle):
             key (foundation.fnn.network.Network)
         instance_id : str
             key (foundation.fnn.instance.Instance)
-        port : int
-            tcp port
-        backend : str
-            'nccl' | 'mpi' | 'gloo' | 'ucc'
+        init_method : str
+            init method of the process group (foundation.utils.distributed.rendezvous)
+        timeout : int
+            timeout (seconds) of process group operations
+        backend : str | None
+            'nccl' | 'mpi' | 'gloo' | 'ucc' | None -- None selects 'nccl' on cuda and 'gloo' on cpu
         """
-        from torch.cuda import device
-        from torch.distributed import init_process_group
+        from foundation.utils.distributed import process_group
 
         # main rank
         parallel = (fnn.Instance.Foundation & {"instance_id": instance_id}).fetch1("parallel")
         main = rank % parallel == 0
 
-        # cuda device
-        with device(rank):
+        # rank device
+        with ParallelCycle._device(rank, size) as (device, default_backend):
 
-            # distributed process group
-            init_process_group(
-                backend=backend,
-                init_method=f"tcp://0.0.0.0:{port}",
-                rank=rank,
-                world_size=size,
-            )
+            # distributed process group, destroyed on exit
+            with process_group(rank, size, init_method, backend=backend or default_backend, timeout=timeout):
 
-            # model instance
-            key = fnn.Instance.Foundation & {"instance_id": instance_id}
-            instance = Foundation & key
+                # model instance
+                key = fnn.Instance.Foundation & {"instance_id": instance_id}
+                instance = Foundation & key
 
-            # instantiate model
-            instance._instantiate(data_id=data_ids[rank], network_id=network_id, main=main)
+                # instantiate model
+                instance._instantiate(data_id=data_ids[rank], network_id=network_id, main=main, device=device)
 
     @rowmethod
     def instantiate(self, data_id, network_id):
-        from random import randint
-        from torch.cuda import device_count
         from torch.multiprocessing import spawn
+        from foundation.utils.distributed import rendezvous, rendezvous_timeout
         from foundation.fnn.data import DataSet
+        from foundation.utils.cache import shared_dataset_cache
         from foundation.fnn.progress import ModelCheckpoint
 
-        # tcp port
-        port = randint(10000, 60000)
-
         # data set
         data_ids = set((DataSet & self.item).members.fetch("data_id"))
         assert data_id in data_ids, "Invalid data_id"
@@ -348,8 +414,8 @@ class Foundation(ParallelCycle):
         parallel, instance_id = (fnn.Instance.Foundation & self.item).fetch1("parallel", "instance_id")
         size = parallel * len(data_ids)
 
-        # verify cuda devices
-        assert device_count() >= size, "Insufficient cuda devices"
+        # verify devices
+        self._verify_devices(size)
 
         # verify checkpoints
         checkpoint = ModelCheckpoint & {"network_id": network_id, "instance_id": instance_id}
@@ -358,16 +424,25 @@ class Foundation(ParallelCycle):
             assert data_ids == _data_ids, "Invalid checkpoint data_ids"
             assert len(epochs) == 1, "Invalid checkpoint epochs"
 
-        # instantiate with multiprocessing
-        conn = self.key.connection
-        conn.close()
-        spawn(
-            Foundation._spawn,
-            args=(size, sorted(data_ids), network_id, instance_id, port),
-            nprocs=size,
-            join=True,
-        )
-        conn.connect()
+        with shared_dataset_cache() as root:
+
+            # build datasets once, shared by all ranks, if a dataset cache is used
+            if root is not None:
+                self._build_datasets(sorted(data_ids))
+
+            # instantiate with multiprocessing, ranks meet at a rendezvous unique to this spawn
+            conn = self.key.connection
+            conn.close()
+            try:
+                with rendezvous() as init_method:
+                    spawn(
+                        Foundation._spawn,
+                        args=(size, sorted(data_ids), network_id, instance_id, init_method, rendezvous_timeout()),
+                        nprocs=size,
+                        join=True,
+                    )
+            finally:
+                conn.connect()
 
         # yield models
         for data_id in sorted(data_ids):
@@ -59,31 +59,241 @@ class Optimize(TrainType):
         from foundation.fnn.train import Optimizer, Scheduler, Loader, Objective
 
         if checkpoint is None:
-            # scheduler
+            # scheduler and optimizer
             scheduler = (Scheduler & self.item).link.scheduler
-            scheduler._init(epoch=0, cycle=cycle)
-
-            # optimizer
             optimizer = (Optimizer & self.item).link.optimizer
-            optimizer._init(scheduler=scheduler)
-
         else:
             # optimizer
+            scheduler = None
             optimizer = checkpoint["optimizer"]
 
-        # data loader
-        loader = (Loader & self.item).link.loader
-        loader._init(dataset=dataset)
+        yield from _optimize(
+            dataset=dataset,
+            network=network,
+            optimizer=optimizer,
+            scheduler=scheduler,
+            loader=(Loader & self.item).link.loader,
+            objective=(Objective & self.item).link.objective,
+            groups=groups,
+            cycle=cycle,
+        )
+
+    @rowmethod
+    def benchmark(self, data_id, network_id, epochs=1, device=None):
+        """
+        Parameters
+        ----------
+        data_id : str
+            key (foundation.fnn.data.Data)
+        network_id : str
+            key (foundation.fnn.network.Network)
+        epochs : int
+            number of training epochs
+        device : str | None
+            torch device, None selects 'cpu' if cpu usage is enabled (foundation.utils.use_cuda), otherwise 'cuda'
+
+        Returns
+        -------
+        pandas.DataFrame
+            see `benchmark`
+        """
+        from time import perf_counter
+        from foundation.fnn.network import Network
+        from foundation.fnn.train import Loader
+        from foundation.fnn.data import Data
+        from foundation.utils import cpu_enabled
 
-        # training objective
-        objective = (Objective & self.item).link.objective
-        objective._init(network=network)
+        if device is None:
+            device = "cpu" if cpu_enabled() else "cuda"
 
-        # train network
-        for epoch, info in optimizer.optimize(
-            loader=loader,
-            objective=objective,
-            parameters=network.named_parameters(),
-            groups=groups,
-        ):
-            yield epoch, info, {"optimizer": optimizer}, network.state_dict()
+        # dataset loading
+        start = perf_counter()
+        dataset = (Data & {"data_id": data_id}).link.compute.dataset
+        seconds = perf_counter() - start
+
+        # network
+        network = (Network & {"network_id": network_id}).link.network(data_id=data_id).to(device=device)
+
+        # training and validation batches per epoch
+        loader = (Loader & self.item).link.fetch1()
+        batches = loader["training_size"], loader["validation_size"]
+
+        # training epochs
+        training = self.train(dataset=dataset, network=network)
+
+        return _benchmark(training, seconds, *batches, epochs=epochs)
+
+
+# -- Train Functions --
+
+
+def _optimize(dataset, network, optimizer, scheduler, loader, objective, groups=None, cycle=0):
+    """
+    Parameters
+    ----------
+    dataset : fnn.data.dataset.Dataset
+        fnn dataset
+    network : fnn.model.networks.Network
+        fnn network
+    optimizer : fnn.train.optimizers.Optimizer
+        module optimizer, initialized with a scheduler if scheduler is None (i.e. restored from a checkpoint)
+    scheduler : fnn.train.schedulers.Scheduler | None
+        hyperparameter scheduler
+    loader : fnn.train.loaders.DatasetLoader
+        data loader
+    objective : fnn.train.objectives.NetworkObjective
+        network objective
+    groups : Iterable[fnn.train.parallel.ParameterGroup] | None
+        parallel groups
+    cycle : int
+        training cycle
+
+    Yields
+    ------
+    see TrainType.train
+    """
+    if scheduler is not None:
+        scheduler._init(epoch=0, cycle=cycle)
+        optimizer._init(scheduler=scheduler)
+
+    # data loader
+    loader._init(dataset=dataset)
+
+    # training objective
+    objective._init(network=network)
+
+    # train network
+    for epoch, info in optimizer.optimize(
+        loader=loader,
+        objective=objective,
+        parameters=network.named_parameters(),
+        groups=groups,
+    ):
+        yield epoch, info, {"optimizer": optimizer}, network.state_dict()
+
+
+def _benchmark(training, seconds, batches, validation_batches, epochs=1):
+    """
+    Parameters
+    ----------
+    training : Iterator[tuple]
+        training epochs, see TrainType.train
+    seconds : float
+        wall-time of dataset loading
+    batches : int
+        number of training batches per epoch
+    validation_batches : int
+        number of validation batches per epoch
+    epochs : int
+        number of training epochs
+
+    Returns
+    -------
+    pandas.DataFrame
+        see `benchmark`
+    """
+    import pandas as pd
+    from time import perf_counter
+
+    rows = [dict(stage="dataset", epoch=0, seconds=seconds, batches=0, validation_batches=0)]
+    batches = dict(batches=batches, validation_batches=validation_batches)
+
+    # training epochs
+    start = perf_counter()
+    for i, (epoch, info, checkpoint, parameters) in enumerate(training):
+
+        now = perf_counter()
+        rows.append(dict(stage="epoch", epoch=epoch, seconds=now - start, **batches))
+        start = now
+
+        logger.info(f"Epoch {epoch} -- {rows[-1]['seconds']:.2f} seconds")
+
+        if i + 1 >= epochs:
+            break
+
+    rows = pd.DataFrame(rows)
+    rows["batches_per_second"] = rows["batches"] / rows["seconds"]
+
+    return rows
+
+
+def benchmark(network, optimizer, scheduler, loader, objective, data=None, epochs=1, device=None):
+    """Benchmarks training throughput on a synthetic dataset (foundation.utils.synthetic), without database access.
+    The network, optimizer, scheduler, loader and objective are built from explicit parameters instead of rows.
+
+    Parameters
+    ----------
+    network : dict
+        modules and streams of a visual network -- core, perspective, modulation, readout, reduce, unit (fnn modules,
+        e.g. `(foundation.fnn.core.Core & key).link.nn`), streams (int) -- see foundation.fnn.network.VisualNetwork
+    optimizer : dict
+        optimizer parameters, see foundation.fnn.train.SgdClip
+    scheduler : dict
+        scheduler parameters, see foundation.fnn.train.CosineLr
+    loader : dict
+        loader parameters, see foundation.fnn.train.Batches
+    objective : dict
+        objective parameters, see foundation.fnn.train.NetworkLoss
+    data : dict | None
+        synthetic dataset parameters, see foundation.utils.synthetic.dataset
+    epochs : int
+        number of training epochs
+    device : str | None
+        torch device, None selects 'cpu' if cpu usage is enabled (foundation.utils.use_cuda), otherwise 'cuda'
+
+    Returns
+    -------
+    pandas.DataFrame
+        stage -- str -- "dataset" | "epoch"
+        epoch -- int -- training epoch
+        seconds -- float -- wall-time of the stage
+        batches -- int -- number of training batches
+        validation_batches -- int -- number of validation batches, included in the wall-time of an epoch
+        batches_per_second -- float -- training batch throughput, a lower bound as the epoch includes validation
+    """
+    from time import perf_counter
+    from fnn.model.networks import Visual
+    from fnn.train.optimizers import SgdClip
+    from fnn.train.schedulers import CosineLr
+    from fnn.train.loaders import Batches
+    from fnn.train.objectives import NetworkLoss
+    from foundation.utils import synthetic, cpu_enabled
+
+    if device is None:
+        device = "cpu" if cpu_enabled() else "cuda"
+
+    data = dict(data or {})
+
+    # dataset generation
+    start = perf_counter()
+    dataset = synthetic.dataset(**data)
+    seconds = perf_counter() - start
+
+    # data dimensions, from an empty trial
+    sizes = {k: v for k, v in data.items() if k not in ["trials", "training_fraction", "samples", "lazy"]}
+    sizes = {k: v.shape[-1] for k, v in synthetic.trial(0, **dict(sizes, samples=0)).items()}
+
+    # network
+    network = dict(network)
+    streams = network.pop("streams")
+    module = Visual(**network)
+    module._init(
+        stimuli=sizes["stimuli"],
+        perspectives=sizes["perspectives"],
+        modulations=sizes["modulations"],
+        units=sizes["units"],
+        streams=streams,
+    )
+    module = module.to(device=device)
+
+    # training epochs
+    training = _optimize(
+        dataset=dataset,
+        network=module,
+        optimizer=SgdClip(**optimizer),
+        scheduler=CosineLr(**scheduler),
+        loader=Batches(**loader),
+        objective=NetworkLoss(**objective),
+    )
+
+    return _benchmark(training, seconds, loader["training_size"], loader["validation_size"], epochs=epochs)
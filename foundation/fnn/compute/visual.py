@@ -34,7 +34,8 @@ class VisualRecordingCorrelation:
         from foundation.stimulus.video import VideoSet
         from foundation.fnn.model import Model
         from foundation.fnn.data import Data
-        from foundation.utils.response import Trials, concatenate
+        from foundation.utils.response import concatenate
+        from foundation.utils.resample import truncate
         from foundation.utils import cuda_enabled
 
         # load model
@@ -100,6 +101,12 @@ class VisualRecordingCorrelation:
 
                 assert len(trial_ids) == len(_targs) == len(_preds)
 
+                # video targets and predictions -- [trials, samples, units]
+                _targs = np.stack(truncate(*_targs, tolerance=0), axis=0)
+                _preds = np.stack(truncate(*_preds, tolerance=0), axis=0)
+
+                assert _targs.shape == _preds.shape
+
                 trials.append(trial_ids)
                 targs.append(_targs)
                 preds.append(_preds)
@@ -109,32 +116,9 @@ class VisualRecordingCorrelation:
             logger.warning(f"No trials found")
             return
 
-        # correlations
-        cc = (Correlation & self.item).link.correlation
-        correlations = []
-
-        for i in tqdm(range(data.units), desc="Units"):
-
-            # unit targets and predictions
-            unit_targ = []
-            unit_pred = []
-
-            for index, t, p in zip(trials, targs, preds):
-
-                # target and prediction trials
-                _unit_targ = Trials([_[:, i] for _ in t], index=index)
-                _unit_pred = Trials([_[:, i] for _ in p], index=index)
-
-                assert _unit_targ.matches(_unit_pred)
-
-                unit_targ.append(_unit_targ)
-                unit_pred.append(_unit_pred)
-
-            # concatenated targets and predictions
-            unit_targ = concatenate(*unit_targ, burnin=self.item["burnin"])
-            unit_pred = concatenate(*unit_pred, burnin=self.item["burnin"])
-
-            # unit correlation
-            correlations.append(cc(unit_targ, unit_pred))
+        # concatenated targets and predictions -- [trials, samples, units]
+        targs = concatenate(*targs, burnin=self.item["burnin"])
+        preds = concatenate(*preds, burnin=self.item["burnin"])
 
-        return np.array(correlations)
+        # unit correlations
+        return (Correlation & self.item).link.correlation(targs, preds)
@@ -23,6 +23,7 @@ class VisualSpec:
     -> utility.Standardize.proj(standardize_id_perspective="standardize_id")
     -> utility.Standardize.proj(standardize_id_modulation="standardize_id")
     -> utility.Standardize.proj(standardize_id_unit="standardize_id")
+    -> utility.Codec
     """
 
 
@@ -107,13 +108,41 @@ class Sensorium2023(DataType):
     split_seed          : int unsigned  # split seed
     """
 
+    @rowproperty
+    def compute(self):
+        from foundation.fnn.compute.data import Sensorium2023
+
+        return Sensorium2023 & self
+
+
+@schema.lookup
+class Synthetic(DataType):
+    definition = """
+    trials              : int unsigned  # number of trials
+    training_fraction   : decimal(6, 6) # fraction of training trials
+    samples             : int unsigned  # samples per trial
+    height              : int unsigned  # stimulus height (pixels)
+    width               : int unsigned  # stimulus width (pixels)
+    channels            : int unsigned  # stimulus channels
+    perspectives        : int unsigned  # perspective features
+    modulations         : int unsigned  # modulation features
+    units               : int unsigned  # units
+    seed                : int unsigned  # random seed
+    """
+
+    @rowproperty
+    def compute(self):
+        from foundation.fnn.compute.data import Synthetic
+
+        return Synthetic & self
+
 
 # -- Data --
 
 
 @schema.link
 class Data:
-    links = [VisualScan, VisualScanRaw]
+    links = [VisualScan, VisualScanRaw, Sensorium2023, Synthetic]
     name = "data"
     comment = "fnn data"
 
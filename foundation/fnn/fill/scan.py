@@ -18,7 +18,7 @@ class _VisualScanData:
     def datatype(self):
         raise NotImplementedError()
 
-    def fill(self, training_tier=0, validation_tier=1):
+    def fill(self, training_tier=0, validation_tier=1, processes=1):
         """
         Parameters
         ----------
@@ -26,11 +26,14 @@ class _VisualScanData:
             training tier index
         validation_tier : int
             validation tier index
+        processes : int
+            number of trials resampled concurrently
         """
-        from foundation.utility import standardize
+        from foundation.utils import use_processes
         from foundation.stimulus import resize
-        from foundation.recording import trial, trace, scan, tier, stat, resample
-        from foundation.fnn.data import VisualScan, Data
+        from foundation.recording import trial, scan, tier, stat, resample
+        from foundation.recording.standardize import StandardizedTraces
+        from foundation.fnn.data import Data
 
         # filtered trials and traces
         scan.ScanTrials.populate(self.key, display_progress=True, reserve_jobs=True)
@@ -81,19 +84,23 @@ class _VisualScanData:
 
                     # traces
                     traceset = table & key
-                    traces = (trace.TraceSet & traceset).members
 
-                    # stats
-                    stats = (standardize.Standardize & _spec).link.summary_ids
-                    stats = [{"summary_id": _} for _ in stats]
+                    # trace set key
+                    _key = dict(
+                        _spec.fetch1(),
+                        traceset_id=traceset.fetch1("traceset_id"),
+                        trialset_id=filt_trials.fetch1("trialset_id"),
+                    )
 
                     # populate traces
-                    stat.TraceSummary.populate(
-                        traces, filt_trials, stats, _spec, display_progress=True, reserve_jobs=True
-                    )
-                    resample.ResampledTraces.populate(
-                        traceset, all_trials, _spec, display_progress=True, reserve_jobs=True
-                    )
+                    stat.TraceSetSummary.populate(_key, display_progress=True, reserve_jobs=True)
+                    StandardizedTraces.populate(_key, display_progress=True, reserve_jobs=True)
+
+                    # trace set matrix, written for all trials of the scan recording
+                    _key = dict(_key, trialset_id=(scan.ScanRecording & key).fetch1("trialset_id"))
+
+                    with use_processes(processes):
+                        resample.ResampledTracesMatrix.populate(_key, display_progress=True, reserve_jobs=True)
 
             # insert
             key = dict(key, training_tier=training_tier, validation_tier=validation_tier)
@@ -169,6 +176,35 @@ class VisualScanDataRaw(_VisualScanData):
         return fnn.VisualScanRaw
 
 
+def _fill_individual(key):
+    """
+    Parameters
+    ----------
+    key : dict
+        key (foundation.fnn.data.Data, foundation.fnn.network.Network, foundation.fnn.instance.Instance.Individual)
+    """
+    from foundation.fnn.model import Model
+
+    # instance parameters
+    instance = (fnn.Instance.Individual & key).fetch1()
+    instance.pop("instance_id")
+
+    # train each cycle sequentially
+    for cycle in range(instance["cycle"] + 1):
+
+        # break if previous model cycle has not been trained
+        if cycle and not Model & _key:
+            break
+
+        # cycle instance
+        _instance = dict(instance, cycle=cycle)
+        _instance_id = (fnn.Instance.Individual & _instance).fetch1("instance_id")
+
+        # populate model
+        _key = dict(key, instance_id=_instance_id)
+        Model.populate(_key, reserve_jobs=True)
+
+
 @keys
 class VisualScanIndividualModel:
     """Visual Scan Individual Model"""
@@ -181,29 +217,69 @@ class VisualScanIndividualModel:
             fnn.Instance.Individual,
         ]
 
-    def fill(self):
-        from foundation.fnn.model import Model
-
+    def fill(
+        self, concurrent=False, cores=None, memory=None, devices=None, job_memory=None, rank_cores=1, log_dir=None
+    ):
+        """
+        Parameters
+        ----------
+        concurrent : bool
+            train instances concurrently, packed within the resource budget | train instances sequentially
+        cores : int | None
+            cpu cores available for packing, None uses all cores of the host
+        memory : float | None
+            memory available for packing (GB), None uses the physical memory of the host
+        devices : Sequence[int] | None
+            cuda devices available for packing, None uses all cuda devices -- ignored if cpu usage is enabled
+        job_memory : float | None
+            memory required by each instance (GB) -- required if concurrent
+        rank_cores : int
+            cpu cores per distributed rank, also the number of torch threads per rank if cpu usage is enabled
+        log_dir : str | None
+            directory of per-instance log files, None keeps the output in the calling process
+        """
+        if not concurrent:
+            for key in self.key:
+                _fill_individual(key)
+            return
+
+        if job_memory is None or float(job_memory) <= 0:
+            raise ValueError("job_memory must be set to the memory required by each instance when filling concurrently")
+
+        from torch.cuda import device_count
+        from foundation.utils import cpu_enabled
+        from foundation.utils.schedule import Job, pack
+
+        # cpu | cuda usage
+        cpu = cpu_enabled()
+        if cpu:
+            devices = None
+        elif devices is None:
+            devices = range(device_count())
+
+        # one job per instance, with the resources of its distributed ranks
+        jobs = []
         for key in self.key:
 
-            # instance parameters
-            instance = (fnn.Instance.Individual & key).fetch1()
-            instance.pop("instance_id")
+            parallel = (fnn.Instance.Individual & key).fetch1("parallel")
 
-            # train each cycle sequentially
-            for cycle in range(instance["cycle"] + 1):
-
-                # break if previous model cycle has not been trained
-                if cycle and not Model & _key:
-                    break
+            job = Job(
+                name=f"{key['data_id']}-{key['network_id']}-{key['instance_id']}",
+                target=_fill_individual,
+                args=[key],
+                cores=parallel * rank_cores,
+                memory=job_memory,
+                devices=0 if cpu else parallel,
+                env={"FOUNDATION_CUDA": f"cpu:{rank_cores}"} if cpu else None,
+            )
+            jobs.append(job)
 
-                # cycle instance
-                _instance = dict(instance, cycle=cycle)
-                _instance_id = (fnn.Instance.Individual & _instance).fetch1("instance_id")
+        # run jobs concurrently
+        codes = pack(jobs, cores=cores, memory=memory, devices=devices, log_dir=log_dir)
 
-                # populate model
-                _key = dict(key, instance_id=_instance_id)
-                Model.populate(_key, reserve_jobs=True)
+        failed = {name: code for name, code in codes.items() if code}
+        if failed:
+            raise RuntimeError(f"Instances failed with exit codes {failed}")
 
 
 @keys
@@ -274,8 +350,7 @@ class VisualScanCorrelation:
 
     def fill_cc_max(self):
         from foundation.fnn.data import Data
-        from foundation.recording.visual import VisualMeasure
-        from foundation.recording.trace import TraceSet
+        from foundation.recording.visual import VisualSetMeasure
 
         keys = U("data_id", "trial_filterset_id", "videoset_id", "burnin") & self.key
 
@@ -283,14 +358,11 @@ class VisualScanCorrelation:
 
             # unit key
             _key = (Data & key).link.compute.key_unit
-            _key.pop("trial_filterset_id")
 
-            # unit traces
-            traces = (TraceSet & _key).members
+            # measure key
+            _key = dict(_key, **key, measure_id=utility.Measure.CCMax.fetch1("measure_id"))
 
             with cache_rowproperty():
 
                 # unit measures
-                VisualMeasure.populate(
-                    key, _key, traces, utility.Measure.CCMax, reserve_jobs=True, display_progress=True
-                )
+                VisualSetMeasure.populate(_key, reserve_jobs=True, display_progress=True)
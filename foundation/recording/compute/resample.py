@@ -185,6 +185,52 @@ class ResampledTraces:
 
         return tuple(resamplers)
 
+    @rowproperty
+    def resampler(self):
+        """
+        Returns
+        -------
+        Callable[[float, float], 2D array]
+            callable, resamples the trace set -- [samples, traces], ordered by traceset_index
+        """
+        return self.subset_resampler(slice(None))
+
+    @rowmethod
+    def subset_resampler(self, index):
+        """
+        Parameters
+        ----------
+        index : 1D array | slice
+            [traces'] -- traceset indexes of a subset of the traces
+
+        Returns
+        -------
+        Callable[[float, float], 2D array]
+            callable, resamples the subset of the trace set -- [samples, traces'], ordered by the index
+        """
+        from foundation.utility.resample import Rate, Offset, Resample
+        from foundation.recording.compute.trace import Traces
+
+        # bulk traces
+        traces = (Traces & self.item).scan_traces
+
+        if traces is None:
+            # individual trace resamplers
+            resamplers = self.resamplers
+            resamplers = resamplers[index] if isinstance(index, slice) else [resamplers[i] for i in index]
+            return lambda start, end: np.stack([r(start, end) for r in resamplers], axis=1)
+
+        # resampling period, offset, method
+        period = (Rate & self.item).link.period
+        offset = (Offset & self.item).link.offset
+        resample = (Resample & self.item).link.resample
+
+        # trace set resampler, with trace delays applied as sampling offsets
+        times, delays, values = traces
+        return resample(
+            times=times, values=values[:, index], target_period=period, target_offset=offset - delays[index]
+        )
+
     @rowmethod
     def trial(self, trial_id):
         """
@@ -207,15 +253,19 @@ class ResampledTraces:
         start, end = (recording.TrialBounds & {"trial_id": trial_id}).fetch1("start", "end")
 
         # resampled traces
-        return np.stack([r(start, end) for r in self.resamplers], axis=1)
+        return self.resampler(start, end)
 
     @rowmethod
-    def trials(self, trial_ids):
+    def trials(self, trial_ids, processes=1, index=None):
         """
         Parameters
         ----------
         trial_id : Sequence[str]
             sequence of keys (foundation.recording.trial.Trial)
+        processes : int
+            number of trials resampled concurrently by forked worker processes
+        index : 1D array | None
+            [traces'] -- traceset indexes of a subset of the traces | None -- all traces
 
         Yields
         ------
@@ -224,15 +274,77 @@ class ResampledTraces:
         """
         from foundation.recording.compute.trace import Traces
 
+        # start and end times of the trace set trials
+        trials = recording.TrialBounds & (Traces & self.item).trials
+        bounds = {t: (s, e) for t, s, e in zip(*trials.fetch("trial_id", "start", "end"))}
+
         # verify trial_ids
-        assert not set(trial_ids) - (Traces & self.item).trial_ids, "Invalid trial_ids"
+        assert not set(trial_ids) - bounds.keys(), "Invalid trial_ids"
 
-        # trace resamplers
-        resamplers = self.resamplers
+        # trace set resampler
+        resampler = self.resampler if index is None else self.subset_resampler(index)
 
-        for trial_id in trial_ids:
-            # trial start and end times
-            start, end = (recording.TrialBounds & {"trial_id": trial_id}).fetch1("start", "end")
+        # requested trial start and end times
+        bounds = [bounds[trial_id] for trial_id in trial_ids]
+
+        if processes > 1:
+            # resampled traces, computed by workers that share the resampler state via fork
+            yield from _fork_map(resampler, bounds, processes)
+
+        else:
+            for start, end in bounds:
+                # resampled traces
+                yield resampler(start, end)
+
+
+# -- Parallel Resampling --
+
+_resampler = None
+
+
+def _resample(bounds):
+    return _resampler(*bounds)
+
+
+def _fork_map(resampler, bounds, processes):
+    """
+    Parameters
+    ----------
+    resampler : Callable[[float, float], 2D array]
+        trace set resampler
+    bounds : Sequence[tuple[float, float]]
+        trial start and end times
+    processes : int
+        number of worker processes
+
+    Yields
+    ------
+    2D array
+        [samples, traces] -- resampled traces, in the order of bounds
+    """
+    import multiprocessing as mp
+    from datajoint import conn
+
+    global _resampler
+
+    prev = _resampler
+    _resampler = resampler
+
+    try:
+        # workers never query the database. The connection is closed around the fork and reopened after it, unless a
+        # transaction is open (e.g. populate), which closing would abort -- workers then inherit it without using it
+        connection = conn()
+        reconnect = not connection.in_transaction
+
+        if reconnect:
+            connection.close()
+        try:
+            pool = mp.get_context("fork").Pool(processes)
+        finally:
+            if reconnect:
+                connection.connect()
 
-            # resampled traces
-            yield np.stack([r(start, end) for r in resamplers], axis=1)
+        with pool:
+            yield from pool.imap(_resample, bounds)
+    finally:
+        _resampler = prev
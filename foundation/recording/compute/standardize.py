@@ -66,12 +66,14 @@ class StandardizedTraces:
         ]
 
     @rowproperty
-    def transform(self):
+    def statistics(self):
         """
         Returns
         -------
-        foundation.utility.standardize.Standardize
-            callable, standardizes trace set
+        1D array
+            [traces] -- dtype=bool -- homogeneous | unrestricted transform
+        dict[str, 1D array]
+            summary_id -> [traces] -- summary statistics
         """
         from foundation.utility.standardize import Standardize
         from foundation.recording.trace import TraceSet
@@ -98,5 +100,29 @@ class StandardizedTraces:
             sid = skey["summary_id"]
             kwargs[sid] = (stats & skey).fetch("summary", order_by="traceset_index")
 
+        return hom, kwargs
+
+    @rowproperty
+    def transform(self):
+        """
+        Returns
+        -------
+        foundation.utility.standardize.Standardize
+            callable, standardizes trace set
+        """
+        from foundation.utility.standardize import Standardize
+        from foundation.recording import standardize
+
+        # standardization statistics, loaded from the cache if available
+        cache = standardize.StandardizedTraces & self.item & {"version": standardize.StandardizedTraces.version}
+
+        if cache:
+            hom, kwargs = cache.fetch1("homogeneous", "summaries")
+        else:
+            hom, kwargs = self.statistics
+
+        # standardization link
+        stand = (Standardize & self.item).link
+
         # standarization transform
         return stand.standardize(homogeneous=hom, **kwargs)
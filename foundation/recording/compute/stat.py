@@ -1,5 +1,4 @@
-import numpy as np
-from djutils import keys, rowproperty
+from djutils import keys, rowproperty, rowmethod
 from foundation.virtual import utility, recording
 
 
@@ -36,9 +35,58 @@ class TraceSummary:
         # recording trials
         trial_ids = (TrialSet & self.item).members.fetch("trial_id", order_by="trialset_index")
 
-        # resampled traces
-        trials = (ResampledTrace & self.item).trials(trial_ids)
-        trials = np.concatenate(list(trials))
+        # summary accumulator
+        summary = (Summary & self.item).link.accumulator()
+
+        # accumulate resampled traces
+        for trial in (ResampledTrace & self.item).trials(trial_ids):
+            summary.update(trial)
 
         # summary statistic
-        return (Summary & self.item).link.summary(trials)
+        return summary.value
+
+
+@keys
+class TraceSetSummary:
+    """Trace Set Summary"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialSet & "members > 0",
+            utility.Resample,
+            utility.Offset,
+            utility.Rate,
+        ]
+
+    @rowmethod
+    def summaries(self, summary_ids):
+        """
+        Parameters
+        ----------
+        summary_ids : Sequence[str]
+            keys (foundation.utility.stat.Summary)
+
+        Returns
+        -------
+        dict[str, 1D array]
+            summary_id -> [traces] -- trace summary statistics, ordered by traceset_index
+        """
+        from foundation.utility.stat import Summary
+        from foundation.recording.trial import TrialSet
+        from foundation.recording.compute.resample import ResampledTraces
+
+        # recording trials
+        trial_ids = (TrialSet & self.item).members.fetch("trial_id", order_by="trialset_index")
+
+        # summary accumulators
+        summaries = {s: (Summary & {"summary_id": s}).link.accumulator() for s in summary_ids}
+
+        # accumulate the resampled trace set, resampled once for all summaries
+        for trial in (ResampledTraces & self.item).trials(trial_ids):
+            for summary in summaries.values():
+                summary.update(trial)
+
+        # summary statistics
+        return {s: summary.value for s, summary in summaries.items()}
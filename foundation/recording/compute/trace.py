@@ -1,5 +1,5 @@
 import numpy as np
-from djutils import keys, merge, rowmethod, rowproperty
+from djutils import keys, merge, rowproperty
 from foundation.virtual.bridge import pipe_fuse, pipe_shared, pipe_tread, resolve_pipe
 from foundation.virtual import scan, recording
 
@@ -61,11 +61,244 @@ class ScanTraceType(TraceType):
         return merge(self.key, recording.ScanRecording).fetch1("trialset_id")
 
 
+class ScanUnitType(ScanTraceType):
+    """Scan Unit Trace"""
+
+    @property
+    def trace_table(self):
+        """
+        Returns
+        -------
+        foundation.recording.trace.Trace.* (ScanUnit | ScanUnitRaw)
+            trace part table
+        """
+        raise NotImplementedError()
+
+    @property
+    def matrix_table(self):
+        """
+        Returns
+        -------
+        foundation.recording.scan.* (ScanUnitMatrix | ScanUnitRawMatrix)
+            trace matrix table
+        """
+        raise NotImplementedError()
+
+    def _scan_values(self, pipe, unit_ids):
+        """
+        Parameters
+        ----------
+        pipe : pipe_meso | pipe_reso
+            scan pipeline
+        unit_ids : 1D array
+            [units] -- unit order
+
+        Returns
+        -------
+        2D array
+            [time, units] -- unit trace values, fetched from the scan pipeline
+        """
+        raise NotImplementedError()
+
+    @rowproperty
+    def _values(self):
+        """
+        Returns
+        -------
+        1D array
+            unit trace values, fetched from the scan pipeline
+        """
+        raise NotImplementedError()
+
+    @rowproperty
+    def times(self):
+        times = (scan.Scan & self.item).fetch1("scan_times")
+        delay = (resolve_pipe(self.item).ScanSet.UnitInfo & self.item).fetch1("ms_delay") / 1000
+        return times + delay
+
+    @rowproperty
+    def values(self):
+        from foundation.utils import npy
+
+        # trace matrix
+        index = merge(self.key, self.trace_table, self.matrix_table.Index)
+
+        if index:
+            path = matrix_file(self.matrix_table & index)
+            return np.array(npy.load(path)[index.fetch1("matrix_index")])
+
+        return self._values
+
+    def scan_traces(self, unit_ids=None):
+        """Loads the traces of the units of a single scan in bulk
+
+        Parameters
+        ----------
+        unit_ids : Sequence[int] | None
+            unit order -- None: ordered by unit_id
+
+        Returns
+        -------
+        1D array
+            [time] -- scan times
+        1D array
+            [units] -- unit delays (seconds)
+        2D array
+            [time, units] -- unit trace values
+        """
+        from foundation.utils import npy
+
+        # single scan
+        key = scan.Scan & self.key
+        if len(key) != 1:
+            raise ValueError("Units must belong to a single scan")
+
+        # scan pipeline
+        pipe = resolve_pipe(key.fetch1("KEY"))
+
+        # scan times
+        times = key.fetch1("scan_times")
+
+        # unit delays
+        _unit_ids, delays = (pipe.ScanSet.UnitInfo & self.key).fetch("unit_id", "ms_delay", order_by="unit_id")
+
+        # unit order
+        if unit_ids is None:
+            unit_ids = _unit_ids
+        else:
+            unit_ids = np.asarray(unit_ids)
+
+        delays = delays[_unit_index(_unit_ids, unit_ids)] / 1000
+
+        # trace matrix
+        index = merge(self.key, self.trace_table, self.matrix_table.Index)
+        matrix_ids, rows = index.fetch("unit_id", "matrix_index", order_by="unit_id")
+        matrix = self.matrix_table & index
+
+        if len(matrix) == 1 and np.isin(unit_ids, matrix_ids).all():
+            # read of the matrix rows of the units
+            rows = rows[np.searchsorted(matrix_ids, unit_ids)]
+            values = npy.load(matrix_file(matrix))[rows].T
+        else:
+            # unit traces from the scan pipeline
+            values = self._scan_values(pipe, unit_ids)
+
+        return times, delays, values
+
+    def scan_matrix(self):
+        """Materializes the traces of the units of a single scan
+
+        Returns
+        -------
+        1D array
+            [units] -- trace_id of each matrix row, ordered by unit_id
+        2D array
+            [units, frames] -- dtype=np.float32 -- unit trace values, C-contiguous
+        """
+        # unit traces
+        units = merge(self.key, self.trace_table)
+        unit_ids, trace_ids = units.fetch("unit_id", "trace_id", order_by="unit_id")
+
+        # unit trace values
+        values = self._scan_values(resolve_pipe((scan.Scan & self.key).fetch1("KEY")), unit_ids)
+
+        return trace_ids, np.ascontiguousarray(values.T, dtype=np.float32)
+
+
+def matrix_path(name):
+    """
+    Parameters
+    ----------
+    name : str
+        trace matrix file name
+
+    Returns
+    -------
+    str
+        trace matrix file path, within the stage of the matrix store
+    """
+    from os.path import join
+    from datajoint import config
+
+    return join(config["stores"]["matrix"]["stage"], name)
+
+
+_matrix_files = dict()
+
+
+def matrix_file(matrix, attribute="matrix"):
+    """
+    Parameters
+    ----------
+    matrix : datajoint.Table
+        single row with a filepath attribute
+    attribute : str
+        filepath attribute
+
+    Returns
+    -------
+    str | None
+        local path of the matrix file -- datajoint checksums the whole file when it is fetched, so paths are cached
+        for the lifetime of the process
+    """
+    from datajoint.hash import key_hash
+
+    key = matrix.full_table_name, attribute, key_hash(matrix.fetch1("KEY"))
+
+    if key not in _matrix_files:
+        _matrix_files[key] = matrix.fetch1(attribute)
+
+    return _matrix_files[key]
+
+
+def _unit_index(_unit_ids, unit_ids):
+    """
+    Parameters
+    ----------
+    _unit_ids : 1D array
+        [units] -- available units, sorted and unique
+    unit_ids : 1D array
+        [units'] -- requested units, a subset of the available units
+
+    Returns
+    -------
+    1D array
+        [units'] -- index of the requested units
+    """
+    if len(np.unique(_unit_ids)) != len(_unit_ids):
+        raise ValueError("Units must be uniquely identified by unit_id")
+
+    missing = np.setdiff1d(unit_ids, _unit_ids)
+    if missing.size:
+        raise ValueError(f"Traces of units {missing.tolist()} were not found")
+
+    return np.searchsorted(_unit_ids, unit_ids)
+
+
+def _stack_traces(traces, unit_ids):
+    """
+    Parameters
+    ----------
+    traces : datajoint.Table
+        rows with unit_id and trace attributes
+    unit_ids : 1D array
+        [units] -- unit order, a subset of the units of the rows
+
+    Returns
+    -------
+    2D array
+        [time, units] -- unit traces
+    """
+    _unit_ids, traces = traces.fetch("unit_id", "trace", order_by="unit_id")
+
+    return np.stack(traces[_unit_index(_unit_ids, unit_ids)], axis=1)
+
+
 # -- Trace Types --
 
 
 @keys
-class ScanUnit(ScanTraceType):
+class ScanUnit(ScanUnitType):
     """Scan Unit Trace"""
 
     @property
@@ -76,14 +309,20 @@ class ScanUnit(ScanTraceType):
             pipe_shared.SpikeMethod,
         ]
 
-    @rowproperty
-    def times(self):
-        times = (scan.Scan & self.item).fetch1("scan_times")
-        delay = (resolve_pipe(self.item).ScanSet.UnitInfo & self.item).fetch1("ms_delay") / 1000
-        return times + delay
+    @property
+    def trace_table(self):
+        return recording.Trace.ScanUnit
+
+    @property
+    def matrix_table(self):
+        return recording.ScanUnitMatrix
+
+    def _scan_values(self, pipe, unit_ids):
+        values = _stack_traces(pipe.Activity.Trace & self.key, unit_ids)
+        return values.clip(0, out=values)
 
     @rowproperty
-    def values(self):
+    def _values(self):
         return (resolve_pipe(self.item).Activity.Trace & self.item).fetch1("trace").clip(0)
 
     @rowproperty
@@ -92,7 +331,7 @@ class ScanUnit(ScanTraceType):
 
 
 @keys
-class ScanUnitRaw(ScanTraceType):
+class ScanUnitRaw(ScanUnitType):
     """Scan Unit Trace -- Fluorescence"""
 
     @property
@@ -102,14 +341,19 @@ class ScanUnitRaw(ScanTraceType):
             pipe_fuse.ScanSet.Unit,
         ]
 
-    @rowproperty
-    def times(self):
-        times = (scan.Scan & self.item).fetch1("scan_times")
-        delay = (resolve_pipe(self.item).ScanSet.UnitInfo & self.item).fetch1("ms_delay") / 1000
-        return times + delay
+    @property
+    def trace_table(self):
+        return recording.Trace.ScanUnitRaw
+
+    @property
+    def matrix_table(self):
+        return recording.ScanUnitRawMatrix
+
+    def _scan_values(self, pipe, unit_ids):
+        return _stack_traces(pipe.Fluorescence.Trace * pipe.ScanSet.Unit & self.key, unit_ids)
 
     @rowproperty
-    def values(self):
+    def _values(self):
         pipe = resolve_pipe(self.item)
         unit = pipe.ScanSet.Unit & self.item
         trace = (pipe.Fluorescence.Trace & unit).fetch1("trace")
@@ -240,3 +484,35 @@ class Traces:
             keys (foundation.recording.Trials)
         """
         return set(self.trials.fetch("trial_id"))
+
+    @rowproperty
+    def scan_traces(self):
+        """
+        Returns
+        -------
+        Tuple[1D array, 1D array, 2D array] | None
+            [time] -- trace times
+            [traces] -- trace delays (seconds)
+            [time, traces] -- trace values, ordered by traceset_index
+            None if the trace set cannot be loaded in bulk
+        """
+        from foundation.recording.trace import TraceSet
+
+        # trace set
+        traces = (TraceSet & self.item).members
+
+        for part, compute in [
+            [recording.Trace.ScanUnit, ScanUnit],
+            [recording.Trace.ScanUnitRaw, ScanUnitRaw],
+        ]:
+            # scan units
+            units = merge(traces, part)
+
+            # bulk load units of a single scan
+            if len(units) == len(traces) and len(scan.Scan & units) == 1:
+
+                # unit ids, ordered by traceset index
+                unit_ids = units.fetch("unit_id", order_by="traceset_index")
+
+                if len(np.unique(unit_ids)) == len(unit_ids):
+                    return (compute & units).scan_traces(unit_ids)
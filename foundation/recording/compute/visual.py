@@ -1,5 +1,5 @@
 import numpy as np
-from djutils import keys, merge, rowproperty, cache_rowproperty, MissingError
+from djutils import keys, merge, rowproperty, cache_rowproperty, U, MissingError
 from foundation.utils import tqdm, logger
 from foundation.virtual import utility, stimulus, recording
 
@@ -108,3 +108,106 @@ class VisualMeasure:
 
         # response measure
         return (Measure & self.item).link.measure(responses)
+
+
+@keys
+class VisualSetMeasure:
+    """Visual Measure -- Trace Set"""
+
+    @property
+    def keys(self):
+        return [
+            recording.TraceSet & "members > 0",
+            recording.TrialFilterSet,
+            stimulus.VideoSet,
+            utility.Resample,
+            utility.Offset,
+            utility.Rate,
+            utility.Measure,
+            utility.Burnin,
+        ]
+
+    # number of traces whose responses are held in memory at once
+    chunk_size = 1024
+
+    @rowproperty
+    def measures(self):
+        """
+        Returns
+        -------
+        1D array | None
+            [traces] -- visual response measures, ordered by traceset_index | None if no trials found
+        """
+        from foundation.recording.compute.resample import ResampledTraces
+        from foundation.recording.trace import TraceSet
+        from foundation.stimulus.video import VideoSet
+        from foundation.utility.response import Measure
+        from foundation.utils.resample import truncate
+        from foundation.utils.response import concatenate
+
+        # trial set, shared by all traces
+        traces = (TraceSet & self.item).members
+        trialset = (U("trialset_id") & merge(traces, recording.TraceTrials)).fetch1()
+
+        # number of traces
+        size = (TraceSet & self.item).fetch1("members")
+
+        # videos
+        videos = (VideoSet & self.item).members
+        videos = videos.fetch("KEY", order_by=videos.primary_key)
+
+        # trial ids of each video
+        video_trials = []
+
+        for video in videos:
+
+            # trial ids
+            trial_ids = (VisualTrials & trialset & video & self.item).trial_ids
+
+            # no trials for video
+            if not trial_ids:
+                logger.warning(f"No trials found for video_id `{video['video_id']}`")
+                continue
+
+            video_trials.append(trial_ids)
+
+        # no trials at all
+        if not video_trials:
+            logger.warning(f"No trials found")
+            return
+
+        # response measure
+        measure = (Measure & self.item).link.measure
+
+        with cache_rowproperty():
+
+            # trace set resampler
+            resampled = ResampledTraces & self.item
+
+            # response measures, computed for chunks of traces
+            measures = []
+
+            for start in tqdm(range(0, size, self.chunk_size), desc="Traces"):
+
+                # traceset indexes of the chunk
+                index = np.arange(start, min(start + self.chunk_size, size))
+
+                # visual responses
+                responses = []
+
+                for trial_ids in video_trials:
+
+                    # trial responses -- [trials, samples, traces]
+                    trials = resampled.trials(trial_ids=trial_ids, index=index)
+                    trials = np.stack(truncate(*trials, tolerance=1), axis=0)
+
+                    # append
+                    responses.append(trials)
+
+                # concatenated responses -- [trials, samples, traces]
+                responses = concatenate(*responses, burnin=self.item["burnin"])
+
+                # response measures
+                measures.append(measure(responses))
+
+        return np.concatenate(measures)
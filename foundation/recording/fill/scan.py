@@ -14,6 +14,10 @@ class _VisualScanRecording:
     def units_homogeneous(self):
         raise NotImplementedError()
 
+    @property
+    def units_matrix(self):
+        raise NotImplementedError()
+
     def fill(self):
         from foundation.recording import trial, trace, scan
 
@@ -43,6 +47,9 @@ class _VisualScanRecording:
         scan.ScanVisualModulations.populate(self.key, display_progress=True, reserve_jobs=True)
         scan.ScanVideoTimeScale.populate(self.key, display_progress=True, reserve_jobs=True)
 
+        # unit trace matrices
+        self.units_matrix.populate(self.key, display_progress=True, reserve_jobs=True)
+
         for key in self.key:
 
             # perspective and modulation traces
@@ -106,6 +113,12 @@ class VisualScanRecording(_VisualScanRecording):
     def units_homogeneous(self):
         return True
 
+    @property
+    def units_matrix(self):
+        from foundation.recording.scan import ScanUnitMatrix
+
+        return ScanUnitMatrix
+
 
 @keys
 class VisualScanRawRecording(_VisualScanRecording):
@@ -127,3 +140,9 @@ class VisualScanRawRecording(_VisualScanRecording):
     @property
     def units_homogeneous(self):
         return False
+
+    @property
+    def units_matrix(self):
+        from foundation.recording.scan import ScanUnitRawMatrix
+
+        return ScanUnitRawMatrix
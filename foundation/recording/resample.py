@@ -1,6 +1,7 @@
 import numpy as np
+import datajoint as dj
 from foundation.virtual import utility
-from foundation.recording.trial import Trial
+from foundation.recording.trial import Trial, TrialSet
 from foundation.recording.trace import TraceSet
 from foundation.schemas import recording as schema
 
@@ -54,13 +55,16 @@ class ResampledTraces:
     -> utility.Resample
     -> utility.Offset
     -> utility.Rate
+    -> utility.Codec
     ---
-    traces      : blob@external     # [samples, traces]
+    traces      : blob@external     # [samples, traces] -- encoded by the codec, see foundation.utils.codec
     finite      : bool              # all values finite
     """
 
     def make(self, key):
+        from foundation.utility.codec import Codec
         from foundation.recording.compute.resample import ResampledTraces
+        from foundation.utils.codec import encode
 
         # resampled traces
         traces = (ResampledTraces & key).trial(trial_id=key["trial_id"])
@@ -68,5 +72,122 @@ class ResampledTraces:
         # trace values finite
         finite = np.isfinite(traces).all()
 
+        # encoded traces
+        traces = encode(traces, *(Codec & key).link.encoding)
+
         # insert
         self.insert1(dict(key, traces=traces, finite=bool(finite)))
+
+
+@schema.computed
+class ResampledTracesMatrix:
+    definition = """
+    -> TraceSet
+    -> TrialSet
+    -> utility.Resample
+    -> utility.Offset
+    -> utility.Rate
+    -> utility.Codec
+    ---
+    matrix          : filepath@matrix   # trace set matrix -- [samples, traces], encoded by the codec
+    affine = NULL   : filepath@matrix   # per-trial affine parameters of quantization codecs -- [trials, 2, traces]
+    """
+
+    class Index(dj.Part):
+        definition = """
+        -> master
+        -> Trial
+        ---
+        matrix_start    : int unsigned      # first sample of the trial
+        matrix_end      : int unsigned      # last sample of the trial, exclusive
+        matrix_trial    : int unsigned      # trial index within the matrix, row of the affine parameters
+        finite          : bool              # all values finite
+        """
+
+    @property
+    def key_source(self):
+        # trial sets whose trials all have samples at the resampling rate
+        trials = (TrialSet & "members > 0").proj("members") * utility.Rate.proj()
+        trials = trials.aggr(TrialSet.Member * TrialSamples, "members", samples="count(*)") & "samples = members"
+
+        # codecs without compression, trials remain contiguous slices of the matrix
+        codecs = utility.Codec.proj() - (utility.Codec.Encoding & "compression != ''")
+
+        keys = (TraceSet & "members > 0").proj() * trials.proj()
+        return keys * utility.Resample.proj() * utility.Offset.proj() * codecs
+
+    def make(self, key):
+        """Writes the trials of a trial set into a trace set matrix. Trials are resampled concurrently by the number of
+        worker processes set by foundation.utils.use_processes.
+
+        The matrix is encoded with the codec of the key. Compression is not supported, so that trials remain contiguous
+        memory-mapped slices. Quantization codecs (uint8, uint16) store per-trial affine parameters in a second file --
+        [trials, 2, traces], offset and scale.
+        """
+        from contextlib import nullcontext
+        from datajoint.hash import key_hash
+        from djutils import MissingError
+        from foundation.utils import npy, tqdm, worker_processes
+        from foundation.utils.codec import quantize
+        from foundation.utility.codec import Codec
+        from foundation.recording.compute.resample import ResampledTraces
+        from foundation.recording.compute.trace import matrix_path
+
+        # trials, ordered by trial set index
+        trials = (TrialSet & key).members * (TrialSamples & key)
+        trial_ids, samples = trials.fetch("trial_id", "samples", order_by="trialset_index")
+
+        if len(trial_ids) != (TrialSet & key).fetch1("members"):
+            raise MissingError("Trial samples are missing for some trials of the trial set")
+
+        # trial bounds within the matrix
+        ends = np.cumsum(samples)
+        starts = ends - samples
+
+        # trace set
+        traces = (TraceSet & key).fetch1("members")
+
+        # matrix codec
+        codec, compression = (Codec & key).link.encoding
+        if compression is not None:
+            raise ValueError("Trace set matrices do not support compression")
+
+        dtype = quantize(np.zeros([0, 0]), codec)[0].dtype
+        affine = codec in ["uint8", "uint16"]
+
+        # matrix files, in the stage of the matrix store
+        path = matrix_path(f"resampled_traces/{key_hash(key)}.npy")
+        affine_path = matrix_path(f"resampled_traces/{key_hash(key)}.affine.npy") if affine else None
+
+        # write trials to the matrix
+        finite = []
+
+        with npy.create(path, shape=[ends[-1], traces], dtype=dtype) as matrix, (
+            npy.create(affine_path, shape=[len(trial_ids), 2, traces], dtype=np.float64) if affine else nullcontext()
+        ) as params:
+
+            resampled = (ResampledTraces & key).trials(trial_ids, processes=worker_processes())
+            resampled = tqdm(resampled, total=len(trial_ids), desc="Trials")
+
+            for i, (start, end, trial) in enumerate(zip(starts, ends, resampled)):
+                assert trial.shape == (end - start, traces)
+
+                # encoded trial
+                data, p = quantize(trial, codec)
+                matrix[start:end] = data
+
+                if affine:
+                    params[i] = p["offset"], p["scale"]
+
+                # trace values finite
+                finite.append(bool(np.isfinite(trial).all()))
+
+        # trial keys
+        keys = [
+            dict(key, trial_id=t, matrix_start=s, matrix_end=e, matrix_trial=i, finite=f)
+            for i, (t, s, e, f) in enumerate(zip(trial_ids, starts, ends, finite))
+        ]
+
+        # insert
+        self.insert1(dict(key, matrix=path, affine=affine_path))
+        self.Index.insert(keys)
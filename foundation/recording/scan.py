@@ -1,4 +1,5 @@
 import numpy as np
+import datajoint as dj
 from djutils import merge
 from foundation.virtual import scan, stimulus
 from foundation.virtual.bridge import pipe_stim, pipe_fuse, pipe_eye, pipe_tread, pipe_shared
@@ -336,3 +337,87 @@ class ScanVisualModulationOrder:
 
         # insert
         self.insert(keys)
+
+
+@schema.computed
+class ScanUnitMatrix:
+    definition = """
+    -> scan.Scan
+    -> pipe_fuse.ScanDone
+    ---
+    matrix          : filepath@matrix   # unit trace matrix -- [units, frames], dtype=float32
+    """
+
+    class Index(dj.Part):
+        definition = """
+        -> master
+        -> Trace
+        ---
+        matrix_index    : int unsigned      # trace matrix row
+        """
+
+    @property
+    def key_source(self):
+        return (scan.Scan * pipe_fuse.ScanDone).proj() & Trace.ScanUnit
+
+    def make(self, key):
+        from datajoint.hash import key_hash
+        from foundation.utils import npy
+        from foundation.recording.compute.trace import ScanUnit, matrix_path
+
+        # unit trace matrix
+        trace_ids, matrix = (ScanUnit & key).scan_matrix()
+
+        # save matrix to the matrix store
+        path = matrix_path(f"scan_unit/{key_hash(key)}.npy")
+        npy.save(path, matrix)
+
+        # trace keys
+        keys = [dict(key, trace_id=t, matrix_index=i) for i, t in enumerate(trace_ids)]
+
+        # insert
+        self.insert1(dict(key, matrix=path))
+        self.Index.insert(keys)
+
+
+@schema.computed
+class ScanUnitRawMatrix:
+    definition = """
+    -> scan.Scan
+    -> pipe_shared.PipelineVersion
+    -> pipe_shared.SegmentationMethod
+    ---
+    matrix          : filepath@matrix   # unit trace matrix -- [units, frames], dtype=float32
+    """
+
+    class Index(dj.Part):
+        definition = """
+        -> master
+        -> Trace
+        ---
+        matrix_index    : int unsigned      # trace matrix row
+        """
+
+    @property
+    def key_source(self):
+        keys = (scan.Scan * pipe_shared.PipelineVersion * pipe_shared.SegmentationMethod).proj()
+        return keys & pipe_fuse.ScanDone & Trace.ScanUnitRaw
+
+    def make(self, key):
+        from datajoint.hash import key_hash
+        from foundation.utils import npy
+        from foundation.recording.compute.trace import ScanUnitRaw, matrix_path
+
+        # unit trace matrix
+        trace_ids, matrix = (ScanUnitRaw & key).scan_matrix()
+
+        # save matrix to the matrix store
+        path = matrix_path(f"scan_unit_raw/{key_hash(key)}.npy")
+        npy.save(path, matrix)
+
+        # trace keys
+        keys = [dict(key, trace_id=t, matrix_index=i) for i, t in enumerate(trace_ids)]
+
+        # insert
+        self.insert1(dict(key, matrix=path))
+        self.Index.insert(keys)
@@ -0,0 +1,36 @@
+from foundation.recording.stat import TraceSetSummary
+from foundation.schemas import recording as schema
+
+
+# ----------------------------- Standardize -----------------------------
+
+
+@schema.computed
+class StandardizedTraces:
+    definition = """
+    -> TraceSetSummary
+    ---
+    version         : int unsigned      # cache version
+    homogeneous     : blob@external     # [traces] -- dtype=bool -- homogeneous | unrestricted transform
+    summaries       : blob@external     # summary_id -> [traces] -- summary statistics
+    """
+
+    # cache version -- rows of other versions are ignored, increment when the cached statistics change, then call
+    # `delete_stale` and populate to recompute the rows of previous versions
+    version = 1
+
+    def make(self, key):
+        from foundation.recording.compute.standardize import StandardizedTraces
+
+        # standardization statistics
+        homogeneous, summaries = (StandardizedTraces & key).statistics
+
+        # insert
+        self.insert1(dict(key, version=self.version, homogeneous=homogeneous, summaries=summaries))
+
+    @classmethod
+    def delete_stale(cls):
+        """Deletes the rows of previous cache versions, so that populate recomputes them. Prompts for confirmation if
+        datajoint.config["safemode"] is set.
+        """
+        (cls & f"version != {cls.version}").delete()
@@ -1,5 +1,5 @@
 from foundation.virtual import utility
-from foundation.recording.trace import Trace
+from foundation.recording.trace import Trace, TraceSet
 from foundation.recording.trial import TrialSet
 from foundation.schemas import recording as schema
 
@@ -28,3 +28,78 @@ class TraceSummary:
 
         # insert
         self.insert1(key)
+
+    @classmethod
+    def fill(cls, key, summary_ids):
+        """Computes the summary statistics of all traces of a trace set in a single pass
+
+        Parameters
+        ----------
+        key : dict[str, str]
+            key (foundation.recording.trace.TraceSet, foundation.recording.trial.TrialSet,
+            foundation.utility.resample.Resample, foundation.utility.resample.Offset,
+            foundation.utility.resample.Rate)
+        summary_ids : Sequence[str]
+            keys (foundation.utility.stat.Summary)
+        """
+        from foundation.recording.compute.stat import TraceSetSummary
+
+        # non-empty trial set
+        if not (TrialSet & key).fetch1("members"):
+            raise ValueError("Trial set has no members")
+
+        # trace set
+        traces = (TraceSet & key).members
+        trace_ids = traces.fetch("trace_id", order_by="traceset_index")
+
+        # summary key
+        key = {k: key[k] for k in ["traceset_id", "trialset_id", "resample_id", "offset_id", "rate_id"]}
+        _key = dict(key)
+        _key.pop("traceset_id")
+
+        # missing summaries
+        summary_ids = [s for s in summary_ids if len(cls & _key & {"summary_id": s} & traces.proj()) < len(traces)]
+
+        if not summary_ids:
+            return
+
+        # summary statistics
+        summaries = (TraceSetSummary & key).summaries(summary_ids)
+
+        # summary keys
+        keys = [
+            dict(_key, trace_id=t, summary_id=s, summary=float(summaries[s][i]))
+            for s in summary_ids
+            for i, t in enumerate(trace_ids)
+        ]
+
+        # insert
+        cls.insert(keys, skip_duplicates=True, allow_direct_insert=True)
+
+
+@schema.computed
+class TraceSetSummary:
+    definition = """
+    -> TraceSet
+    -> TrialSet
+    -> utility.Standardize
+    -> utility.Resample
+    -> utility.Offset
+    -> utility.Rate
+    """
+
+    @property
+    def key_source(self):
+        keys = (TraceSet & "members > 0").proj() * (TrialSet & "members > 0").proj()
+        keys = keys * utility.Standardize.proj()
+        return keys * utility.Resample.proj() * utility.Offset.proj() * utility.Rate.proj()
+
+    def make(self, key):
+        from foundation.utility.standardize import Standardize
+
+        # summary statistics required by the standardization, computed in a single pass over the trace set
+        summary_ids = (Standardize & key).link.summary_ids
+        TraceSummary.fill(key, summary_ids=summary_ids)
+
+        # insert
+        self.insert1(key)
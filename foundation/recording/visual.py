@@ -1,6 +1,6 @@
 from foundation.virtual import utility, stimulus
 from foundation.recording.trial import Trial, TrialFilterSet
-from foundation.recording.trace import Trace
+from foundation.recording.trace import Trace, TraceSet
 from foundation.schemas import recording as schema
 
 
@@ -33,3 +33,68 @@ class VisualMeasure:
 
         # insert
         self.insert1(key)
+
+    @classmethod
+    def fill(cls, key):
+        """Computes the visual measures of all traces of a trace set at once
+
+        Parameters
+        ----------
+        key : dict[str, str]
+            key (foundation.recording.trace.TraceSet, foundation.recording.trial.TrialFilterSet,
+            foundation.stimulus.video.VideoSet, foundation.utility.resample.Resample,
+            foundation.utility.resample.Offset, foundation.utility.resample.Rate,
+            foundation.utility.response.Measure, foundation.utility.response.Burnin)
+        """
+        from foundation.recording.compute.visual import VisualSetMeasure
+
+        # trace set
+        traces = (TraceSet & key).members
+        trace_ids = traces.fetch("trace_id", order_by="traceset_index")
+
+        # measure key
+        attrs = ["trial_filterset_id", "videoset_id", "resample_id", "offset_id", "rate_id", "measure_id", "burnin"]
+        _key = {k: key[k] for k in attrs}
+
+        # missing measures
+        if len(cls & _key & traces.proj()) == len(trace_ids):
+            return
+
+        # visual measures
+        measures = (VisualSetMeasure & _key & {"traceset_id": key["traceset_id"]}).measures
+
+        # trace keys
+        keys = [
+            dict(_key, trace_id=t, measure=None if measures is None else float(measures[i]))
+            for i, t in enumerate(trace_ids)
+        ]
+
+        # insert
+        cls.insert(keys, skip_duplicates=True, allow_direct_insert=True)
+
+
+@schema.computed
+class VisualSetMeasure:
+    definition = """
+    -> TraceSet
+    -> TrialFilterSet
+    -> stimulus.VideoSet
+    -> utility.Resample
+    -> utility.Offset
+    -> utility.Rate
+    -> utility.Measure
+    -> utility.Burnin
+    """
+
+    @property
+    def key_source(self):
+        from foundation.recording.compute.visual import VisualSetMeasure
+
+        return VisualSetMeasure.key_source
+
+    def make(self, key):
+        # visual measures of all traces of the trace set
+        VisualMeasure.fill(key)
+
+        # insert
+        self.insert1(key)
@@ -1,11 +1,20 @@
+import os
 from datajoint import config
 from djutils import Schema
 
+# filepath attributes -- matrix files are written directly to the stage of the matrix store
+os.environ.setdefault("DJ_SUPPORT_FILEPATH_MANAGEMENT", "TRUE")
+
 config["stores"] = {
     "external": dict(
         protocol="file",
         location="/mnt/scratch09/foundation/external/",
     ),
+    "matrix": dict(
+        protocol="file",
+        location="/mnt/scratch09/foundation/matrix/",
+        stage="/mnt/scratch09/foundation/matrix/",
+    ),
 }
 
 utility = Schema("foundation_utility")
@@ -25,6 +25,30 @@ class VideoType:
         """
         raise NotImplementedError()
 
+    @rowproperty
+    def info(self):
+        """
+        Returns
+        -------
+        dict[str, int | str | float | None]
+            frames -- number of video frames
+            height -- video height
+            width -- video width
+            channels -- video channels
+            mode -- video mode
+            period -- video period (seconds)
+        """
+        vid = self.video
+
+        return {
+            "frames": len(vid),
+            "height": vid.height,
+            "width": vid.width,
+            "channels": vid.channels,
+            "mode": vid.mode,
+            "period": vid.period,
+        }
+
 
 class DirectionType(VideoType):
     """Directional Video"""
@@ -47,6 +71,78 @@ class DirectionType(VideoType):
 # -- Video Types --
 
 
+def _info(frames, height, width, channels, mode, period=None):
+    return {
+        "frames": int(frames),
+        "height": int(height),
+        "width": int(width),
+        "channels": int(channels),
+        "mode": mode,
+        "period": None if period is None else float(period),
+    }
+
+
+def _sequence_info(arrays, period):
+    # arrays -- shape and dtype of each movie -- [frames, height, width] | [frames, height, width, channels]
+    shapes = {(shape[1:], dtype) for shape, dtype in arrays}
+    if len(shapes) != 1:
+        raise ValueError("Sequence movies differ in shape")
+
+    shape, dtype = shapes.pop()
+    _, height, width, channels, mode = video.array_info(np.zeros([1, *shape], dtype=dtype))
+    frames = sum(shape[0] for shape, _ in arrays)
+
+    return _info(frames, height, width, channels, mode, period)
+
+
+def _blob_arrays(query, attribute, order_by=None):
+    """Shapes and dtypes of the array blobs of a query, read from the head of each blob without fetching the arrays.
+
+    Relies on the datajoint blob serialization (mYm | dj0 protocol): an optional "ZL123\\0" zlib prefix followed by
+    the uncompressed length (uint64), the protocol string, then "A", ndim (uint64), shape (uint64 x ndim) and the
+    class id (uint32). If any blob has a different layout (e.g. external blobs), the arrays are fetched instead.
+
+    Parameters
+    ----------
+    query : datajoint.expression.QueryExpression
+        rows with an array blob attribute
+    attribute : str
+        array blob attribute
+    order_by : str | None
+        row order
+
+    Returns
+    -------
+    List[tuple[tuple[int], numpy.dtype]]
+        shape and dtype of each array
+    """
+    import zlib
+    from datajoint.blob import dtype_list
+
+    heads = query.proj(head=f"LEFT(`{attribute}`, 1024)").fetch("head", order_by=order_by)
+
+    arrays = []
+    for head in heads:
+
+        if head is not None and head.startswith(b"ZL123\0"):
+            head = zlib.decompressobj().decompress(head[14:])
+
+        if head is None or not head.startswith((b"mYm\0A", b"dj0\0A")):
+            break
+
+        ndim = int(np.frombuffer(head, dtype=np.uint64, count=1, offset=5)[0])
+        shape = np.frombuffer(head, dtype=np.uint64, count=ndim, offset=13)
+        class_id = np.frombuffer(head, dtype=np.uint32, count=1, offset=13 + 8 * ndim)[0]
+
+        arrays.append((tuple(int(_) for _ in shape), np.dtype(dtype_list[class_id])))
+
+    else:
+        return arrays
+
+    # blobs of another layout
+    return [(array.shape, array.dtype) for array in query.fetch(attribute, order_by=order_by)]
+
+
 @keys
 class Clip(VideoType):
     """Clip Video"""
@@ -58,7 +154,7 @@ class Clip(VideoType):
         ]
 
     @rowproperty
-    def video(self):
+    def _clip(self):
         clip = pipe_stim.Movie * pipe_stim.Movie.Clip * pipe_stim.Clip & self.item
         clip, start, end, fps = clip.fetch1("clip", "skip_time", "cut_after", "frame_rate")
 
@@ -66,6 +162,12 @@ class Clip(VideoType):
         start = round(start * fps)
         end = start + round(end * fps)
 
+        return clip, start, end, fps
+
+    @rowproperty
+    def video(self):
+        clip, start, end, fps = self._clip
+
         frames = []
         reader = av.open(io.BytesIO(clip.tobytes()), mode="r")
 
@@ -80,6 +182,24 @@ class Clip(VideoType):
 
         return video.Video(frames, period=1 / fps)
 
+    @rowproperty
+    def info(self):
+        clip, start, end, fps = self._clip
+
+        # container stream info
+        with av.open(io.BytesIO(clip.tobytes()), mode="r") as reader:
+            stream = reader.streams.video[0]
+            height = stream.codec_context.height
+            width = stream.codec_context.width
+
+            # count packets if the container does not report the number of frames
+            total = stream.frames or sum(1 for packet in reader.demux(stream) if packet.size)
+
+        # frames between start and end, converted to grayscale
+        frames = max(min(total, end) - start, 0)
+
+        return _info(frames, height, width, channels=1, mode="L", period=1 / fps)
+
 
 @keys
 class Monet2(DirectionType):
@@ -97,6 +217,12 @@ class Monet2(DirectionType):
         frames = np.einsum("H W C T -> T H W C", frames)
         return video.Video.fromarray(frames, period=1 / float(fps))
 
+    @rowproperty
+    def info(self):
+        movie = pipe_stim.Monet2 & self.item
+        [((height, width, channels, frames), dtype)] = _blob_arrays(movie, "movie")
+        return _sequence_info([((frames, height, width, channels), dtype)], period=1 / float(movie.fetch1("fps")))
+
     @rowmethod
     def directions(self):
         directions, onsets, duration, n_dirs, frac = (pipe_stim.Monet2 & self.item).fetch1(
@@ -129,6 +255,12 @@ class Trippy(VideoType):
         frames = np.einsum("H W T -> T H W", frames)
         return video.Video.fromarray(frames, period=1 / float(fps))
 
+    @rowproperty
+    def info(self):
+        movie = pipe_stim.Trippy & self.item
+        [((height, width, frames), dtype)] = _blob_arrays(movie, "movie")
+        return _sequence_info([((frames, height, width), dtype)], period=1 / float(movie.fetch1("fps")))
+
 
 @keys
 class GaborSequence(VideoType):
@@ -141,16 +273,26 @@ class GaborSequence(VideoType):
         ]
 
     @rowproperty
-    def video(self):
+    def _movies(self):
         sequence = (pipe_stim.GaborSequence & self.item).fetch1()
         fps = (pipe_gabor.Display & sequence).fetch1("fps")
 
         movs = pipe_gabor.Sequence.Gabor * pipe_gabor.Gabor & sequence
-        movs = movs.fetch("movie", order_by="sequence_id ASC")
         assert len(movs) == sequence["sequence_length"]
 
+        return movs, fps
+
+    @rowproperty
+    def video(self):
+        movs, fps = self._movies
+        movs = movs.fetch("movie", order_by="sequence_id ASC")
         return video.Video.fromarray(np.concatenate(movs), period=1 / fps)
 
+    @rowproperty
+    def info(self):
+        movs, fps = self._movies
+        return _sequence_info(_blob_arrays(movs, "movie", order_by="sequence_id ASC"), period=1 / fps)
+
 
 @keys
 class DotSequence(VideoType):
@@ -177,6 +319,22 @@ class DotSequence(VideoType):
 
         return video.Video.fromarray(frames, period=1 / fps)
 
+    @rowproperty
+    def info(self):
+        sequence = (pipe_stim.DotSequence & self.item).fetch1()
+        fps = (pipe_dot.Display & sequence).fetch1("fps")
+
+        imgs = pipe_dot.Dot * pipe_dot.Sequence.Dot * pipe_dot.Display & sequence
+        imgs = _blob_arrays(imgs, "image", order_by="dot_id ASC")
+        assert len(imgs) == sequence["sequence_length"]
+
+        n_frames, id_trace = (pipe_dot.Trace * pipe_dot.Display & sequence).fetch1("n_frames", "id_trace")
+        frames = [imgs[i] for i in np.ravel(id_trace)]
+        assert len(frames) == n_frames
+
+        # images as single-frame movies
+        return _sequence_info([((1, *shape), dtype) for shape, dtype in frames], period=1 / fps)
+
 
 @keys
 class RdkSequence(VideoType):
@@ -189,7 +347,7 @@ class RdkSequence(VideoType):
         ]
 
     @rowproperty
-    def video(self):
+    def _movies(self):
         sequence = (pipe_stim.RdkSequence & self.item).fetch1()
         fps = (pipe_rdk.Display & sequence).fetch1("fps")
 
@@ -197,17 +355,29 @@ class RdkSequence(VideoType):
         for i in range(sequence["sequence_length"]):
             _key = dict(sequence, sequence_id=i)
             if pipe_rdk.Sequence.Rotation & _key:
-                movie = (pipe_rdk.RotationRdk * pipe_rdk.Sequence.Rotation & _key).fetch1("movie")
+                movie = pipe_rdk.RotationRdk * pipe_rdk.Sequence.Rotation & _key
             elif pipe_rdk.Sequence.Radial & _key:
-                movie = (pipe_rdk.RadialRdk * pipe_rdk.Sequence.Radial & _key).fetch1("movie")
+                movie = pipe_rdk.RadialRdk * pipe_rdk.Sequence.Radial & _key
             elif pipe_rdk.Sequence.Translation & _key:
-                movie = (pipe_rdk.TranslationRdk * pipe_rdk.Sequence.Translation & _key).fetch1("movie")
+                movie = pipe_rdk.TranslationRdk * pipe_rdk.Sequence.Translation & _key
             else:
                 raise Exception
             movs += [movie]
 
+        return movs, fps
+
+    @rowproperty
+    def video(self):
+        movs, fps = self._movies
+        movs = [movie.fetch1("movie") for movie in movs]
         return video.Video.fromarray(np.concatenate(movs), period=1 / fps)
 
+    @rowproperty
+    def info(self):
+        movs, fps = self._movies
+        movs = [array for movie in movs for array in _blob_arrays(movie, "movie")]
+        return _sequence_info(movs, period=1 / fps)
+
 
 @keys
 class Frame(VideoType):
@@ -236,6 +406,20 @@ class Frame(VideoType):
         else:
             return video.Video([image, blank], times=[0, duration])
 
+    @rowproperty
+    def info(self):
+        image, pre_blank = (pipe_stim.StaticImage.Image * pipe_stim.Frame & self.item).fetch1(
+            "image", "pre_blank_period"
+        )
+        _, height, width, channels, mode = video.array_info(image[None])
+
+        if mode != "L":
+            raise NotImplementedError(f"Frame mode {mode} not implemented")
+
+        frames = 3 if pre_blank > 0 else 2
+
+        return _info(frames, height, width, channels, mode)
+
 
 @keys
 class FrameList(VideoType):
@@ -290,3 +474,30 @@ class FrameList(VideoType):
                 times += [current_time + pre_blank, current_time + pre_blank + duration]
             current_time = times[-1]
         return video.Video(images, times=times)
+
+    @rowproperty
+    def info(self):
+        members = stimulus.FrameList.Member & self.item
+        if len(members) != (stimulus.FrameList & self.item).fetch1("members"):
+            raise MissingError(f"FrameList {self.item} is missing members")
+
+        tups = merge(
+            members,
+            pipe_stim.StaticImage.Image,
+            pipe_stim.Frame,
+        )
+        images, pre_blanks = tups.fetch("image", "pre_blank_period", order_by="framelist_index")
+
+        shapes = {image.shape for image in images}
+        if len(shapes) != 1:
+            raise ValueError("FrameList images differ in shape")
+
+        _, height, width, channels, mode = video.array_info(images[0][None])
+
+        if mode != "L":
+            raise NotImplementedError(f"Frame mode {mode} not implemented")
+
+        # image and blank per member, with an additional leading blank
+        frames = 2 * len(images) + int(pre_blanks[0] > 0)
+
+        return _info(frames, height, width, channels, mode)
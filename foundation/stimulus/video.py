@@ -174,13 +174,7 @@ class VideoInfo:
     """
 
     def make(self, key):
-        vid = (Video & key).link.compute.video
+        # video info, read without decoding the video frames
+        info = (Video & key).link.compute.info
 
-        key["frames"] = len(vid)
-        key["height"] = vid.height
-        key["width"] = vid.width
-        key["channels"] = vid.channels
-        key["mode"] = vid.mode
-        key["period"] = vid.period
-
-        self.insert1(key)
+        self.insert1(dict(key, **info))
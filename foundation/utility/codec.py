@@ -0,0 +1,59 @@
+from djutils import rowproperty
+from foundation.schemas import utility as schema
+
+
+# ---------------------------- Codec ----------------------------
+
+# -- Codec Interface --
+
+
+class CodecType:
+    """Trace Storage Codec"""
+
+    @rowproperty
+    def encoding(self):
+        """
+        Returns
+        -------
+        None | str
+            None | "float16" | "uint8" | "uint16" -- see foundation.utils.codec.encode
+        None | str
+            None | "zstd" | "blosc" -- compression, see foundation.utils.codec.encode
+        """
+        raise NotImplementedError()
+
+
+# -- Codec Types --
+
+
+@schema.method
+class Float32(CodecType):
+    name = "float32"
+    comment = "single precision, uncompressed"
+
+    @rowproperty
+    def encoding(self):
+        return None, None
+
+
+@schema.lookup
+class Encoding(CodecType):
+    definition = """
+    codec           : varchar(16)   # float16 | uint8 | uint16
+    compression     : varchar(16)   # "" | zstd | blosc
+    """
+
+    @rowproperty
+    def encoding(self):
+        codec, compression = self.fetch1("codec", "compression")
+        return codec, compression or None
+
+
+# -- Codec --
+
+
+@schema.link
+class Codec:
+    links = [Float32, Encoding]
+    name = "codec"
+    comment = "trace storage codec"
@@ -102,13 +102,13 @@ class ResampleType:
         Parameters
         -------
         times : 1D array
-            trace times, monotonically increasing
-        values : 1D array
-            trace values, same length as times
+            [time] -- trace times, monotonically increasing
+        values : 1D array | 2D array
+            [time] | [time, traces] -- trace values, same length as times
         target_period : float
             target sampling period
-        target_offset : float
-            target sampling offset
+        target_offset : float | 1D array
+            target sampling offset | [traces] -- target sampling offset of each trace
 
         Returns
         -------
@@ -1,5 +1,5 @@
 import numpy as np
-from djutils import rowproperty
+from djutils import rowproperty, rowmethod
 from foundation.schemas import utility as schema
 
 
@@ -16,8 +16,19 @@ class SummaryType:
         """
         Returns
         -------
-        Callable[[1D array], float]
-            function that takes a 1D array and returns a summary statistic float
+        Callable[[1D array | 2D array], float | 1D array]
+            function that takes a 1D array and returns a summary statistic float,
+            or takes a 2D array and returns a 1D array of summary statistics along the first axis
+        """
+        raise NotImplementedError()
+
+    @rowmethod
+    def accumulator(self):
+        """
+        Returns
+        -------
+        foundation.utils.stat.Accumulator
+            new streaming accumulator of the summary statistic
         """
         raise NotImplementedError()
 
@@ -32,7 +43,13 @@ class Minimum(SummaryType):
 
     @rowproperty
     def summary(self):
-        return np.min
+        return lambda x: np.min(x, axis=0)
+
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Minimum
+
+        return Minimum()
 
 
 @schema.method
@@ -42,7 +59,13 @@ class Mean(SummaryType):
 
     @rowproperty
     def summary(self):
-        return np.mean
+        return lambda x: np.mean(x, axis=0)
+
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Mean
+
+        return Mean()
 
 
 @schema.lookup
@@ -54,7 +77,51 @@ class Std(SummaryType):
     @rowproperty
     def summary(self):
         ddof = self.fetch1("ddof")
-        return lambda x: np.std(x, ddof=ddof)
+        return lambda x: np.std(x, axis=0, ddof=ddof)
+
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Std
+
+        return Std(ddof=self.fetch1("ddof"))
+
+
+@schema.lookup
+class Quantile(SummaryType):
+    definition = """
+    quantile    : decimal(7, 6)     # quantile, between 0 and 1
+    """
+
+    @rowproperty
+    def summary(self):
+        q = float(self.fetch1("quantile"))
+        return lambda x: np.quantile(x, q, axis=0)
+
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import Quantile
+
+        return Quantile(q=float(self.fetch1("quantile")))
+
+
+@schema.lookup
+class QuantileSketch(SummaryType):
+    definition = """
+    quantile    : decimal(7, 6)     # quantile, between 0 and 1
+    capacity    : int unsigned      # number of values retained per compaction level
+    seed        : int unsigned      # seed for compaction offsets
+    """
+
+    @rowproperty
+    def summary(self):
+        return lambda x: self.accumulator().update(x).value
+
+    @rowmethod
+    def accumulator(self):
+        from foundation.utils.stat import QuantileSketch
+
+        q, capacity, seed = self.fetch1("quantile", "capacity", "seed")
+        return QuantileSketch(q=float(q), capacity=capacity, seed=seed)
 
 
 # -- Summary --
@@ -62,6 +129,6 @@ class Std(SummaryType):
 
 @schema.link
 class Summary:
-    links = [Minimum, Mean, Std]
+    links = [Minimum, Mean, Std, Quantile, QuantileSketch]
     name = "summary"
     comment = "summary statistic"
@@ -1,4 +1,4 @@
-from .context import torch_rng, use_cuda, cuda_enabled
+from .context import use_environ, use_processes, worker_processes, torch_rng, use_cuda, cuda_enabled, cpu_enabled, cpu_threads
 from .logging import get_logger, tqdm, disable_tqdm
 
 logger = get_logger()
@@ -0,0 +1,191 @@
+import os
+import json
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from uuid import uuid4
+from contextlib import contextmanager
+from .npy import save, load
+from .context import use_environ
+
+
+class DatasetCache:
+    """Local dataset cache -- per-trial npy files with a json manifest"""
+
+    version = 2
+
+    def __init__(self, root, name):
+        """
+        Parameters
+        ----------
+        root : str
+            cache root directory
+        name : str
+            dataset name, unique to the dataset and its upstream keys
+        """
+        self.path = os.path.join(root, f"v{self.version}", name)
+        self.manifest = os.path.join(self.path, "manifest.json")
+
+    @property
+    def exists(self):
+        """
+        Returns
+        -------
+        bool
+            whether the cache has been completely written
+        """
+        return os.path.exists(self.manifest)
+
+    @contextmanager
+    def lock(self):
+        """Context manager that holds an exclusive lock on the cache, across processes"""
+        import fcntl
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        with open(f"{self.path}.lock", "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def write(self, index, columns, streams):
+        """Writes the dataset to the cache, atomically replacing any existing cache
+
+        Parameters
+        ----------
+        index : pandas.Index
+            trial index
+        columns : dict[str, 1D array]
+            column name -> [trials] -- scalar column values
+        streams : dict[str, Iterable[ND array]]
+            column name -> trial arrays, in the order of the index
+        """
+        tmp = f"{self.path}.{uuid4().hex}.tmp"
+
+        try:
+            # trial arrays
+            files = {name: [] for name in streams}
+
+            for i, arrays in enumerate(zip(*streams.values())):
+                for name, array in zip(streams, arrays):
+                    file = os.path.join(name, f"{i:06d}.npy")
+                    save(os.path.join(tmp, file), array)
+                    files[name].append(file)
+
+            assert all(len(f) == len(index) for f in files.values())
+
+            # manifest, with dtypes to restore the index and columns
+            columns = {k: np.asarray(v) for k, v in columns.items()}
+            manifest = {
+                "version": self.version,
+                "index": {"name": index.name, "dtype": str(index.dtype), "values": index.tolist()},
+                "columns": {k: {"dtype": str(v.dtype), "values": v.tolist()} for k, v in columns.items()},
+                "files": files,
+            }
+            with open(os.path.join(tmp, "manifest.json"), "w") as f:
+                json.dump(manifest, f)
+
+            # replace cache
+            if os.path.exists(self.path):
+                shutil.rmtree(self.path)
+            os.replace(tmp, self.path)
+
+        finally:
+            if os.path.exists(tmp):
+                shutil.rmtree(tmp)
+
+    def read(self, mmap=True):
+        """
+        Parameters
+        ----------
+        mmap : bool
+            memory-mapped (read-only) | loaded into memory
+
+        Returns
+        -------
+        pandas.DataFrame
+            scalar columns and trial arrays, indexed by trial
+        """
+        with open(self.manifest) as f:
+            manifest = json.load(f)
+
+        assert manifest["version"] == self.version
+
+        data = {k: np.asarray(v["values"], dtype=v["dtype"]) for k, v in manifest["columns"].items()}
+        for name, files in manifest["files"].items():
+            data[name] = [load(os.path.join(self.path, file), mmap=mmap) for file in files]
+
+        index = manifest["index"]
+        index = pd.Index(index["values"], name=index["name"], dtype=index["dtype"])
+        return pd.DataFrame(data, index=index)
+
+
+@contextmanager
+def use_dataset_cache(root):
+    """Context manager that sets the local dataset cache directory
+
+    Parameters
+    ----------
+    root : str | None
+        cache root directory, None disables caching
+    """
+    with use_environ("FOUNDATION_DATASET_CACHE", root or ""):
+        yield
+
+
+def dataset_cache():
+    """Local dataset cache directory
+
+    Returns
+    -------
+    str | None
+        cache root directory, None if caching is disabled
+    """
+    return os.getenv("FOUNDATION_DATASET_CACHE") or None
+
+
+@contextmanager
+def use_shared_dataset_cache():
+    """Context manager that enables a temporary dataset cache in shared memory, when no cache directory is set"""
+    with use_environ("FOUNDATION_SHARED_DATASET_CACHE", 1):
+        yield
+
+
+def shared_dataset_cache_enabled():
+    """
+    Returns
+    -------
+    bool
+        whether a temporary dataset cache in shared memory is enabled
+    """
+    return bool(int(os.getenv("FOUNDATION_SHARED_DATASET_CACHE", "0")))
+
+
+@contextmanager
+def shared_dataset_cache():
+    """Context manager that provides a dataset cache shared by processes on the same host.
+    If no cache directory is set and the shared cache is enabled (`use_shared_dataset_cache`), a temporary directory in
+    shared memory is used and removed on exit. Otherwise no cache is used, and each process builds its own datasets.
+
+    Yields
+    ------
+    str | None
+        cache root directory | None if no cache is used
+    """
+    root = dataset_cache()
+
+    if root is not None or not shared_dataset_cache_enabled():
+        yield root
+        return
+
+    shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    root = tempfile.mkdtemp(prefix="foundation_dataset_", dir=shm)
+
+    try:
+        with use_dataset_cache(root):
+            yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
@@ -0,0 +1,257 @@
+import numpy as np
+from time import perf_counter
+
+
+# ------- Codec Interface -------
+
+
+def quantize(array, codec=None):
+    """Encodes the values of a [samples, traces] array, without compression
+
+    Parameters
+    ----------
+    array : 2D array
+        [samples, traces] -- dtype=float -- values to encode
+    codec : None | str
+        None | "float16" | "uint8" | "uint16" -- single precision | half precision | per-trace affine quantization
+
+    Returns
+    -------
+    2D array
+        [samples, traces] -- encoded values
+    dict[str, 1D array]
+        [traces] -- per-trace affine offset and scale of quantization codecs, empty otherwise
+    """
+    array = np.asarray(array)
+
+    if codec is None:
+        return array.astype(np.float32), dict()
+
+    elif codec == "float16":
+        return array.astype(np.float16), dict()
+
+    elif codec in ["uint8", "uint16"]:
+        dtype = np.dtype(codec)
+        levels = np.iinfo(dtype).max
+
+        # per-trace affine parameters, the maximum level is reserved for non-finite values
+        finite = np.isfinite(array)
+        offset = np.min(array, axis=0, initial=np.inf, where=finite)
+        offset = np.where(np.isfinite(offset), offset, 0)
+        scale = (np.max(array, axis=0, initial=-np.inf, where=finite) - offset) / (levels - 1)
+        scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1)
+
+        # quantized values
+        data = np.rint((np.where(finite, array, offset) - offset) / scale)
+        data = np.where(finite, data, levels).astype(dtype)
+
+        return data, dict(offset=offset.astype(np.float64), scale=scale.astype(np.float64))
+
+    else:
+        raise ValueError(f"codec `{codec}` not recognized")
+
+
+def dequantize(data, codec=None, offset=None, scale=None, out=None):
+    """Decodes the values of a [samples, traces] array, see `quantize`
+
+    Parameters
+    ----------
+    data : 2D array
+        [samples, traces] -- encoded values
+    codec : None | str
+        None | "float16" | "uint8" | "uint16"
+    offset : 1D array | None
+        [traces] -- per-trace affine offset of quantization codecs
+    scale : 1D array | None
+        [traces] -- per-trace affine scale of quantization codecs
+    out : 2D array | None
+        [samples, traces] -- dtype=float32 -- array that the decoded values are written to, None allocates a new array
+
+    Returns
+    -------
+    2D array
+        [samples, traces] -- dtype=float32 -- decoded values
+    """
+    if out is None:
+        out = np.empty(np.shape(data), dtype=np.float32)
+
+    if codec is None or codec == "float16":
+        np.copyto(out, data, casting="same_kind")
+
+    elif codec in ["uint8", "uint16"]:
+        levels = np.iinfo(np.dtype(codec)).max
+        np.multiply(data, np.asarray(scale, dtype=out.dtype), out=out)
+        np.add(out, np.asarray(offset, dtype=out.dtype), out=out)
+        out[data == levels] = np.nan
+
+    else:
+        raise ValueError(f"codec `{codec}` not recognized")
+
+    return out
+
+
+def encode(array, codec=None, compression=None):
+    """Encodes a [samples, traces] array
+
+    Parameters
+    ----------
+    array : 2D array
+        [samples, traces] -- dtype=float -- values to encode
+    codec : None | str
+        None | "float16" | "uint8" | "uint16" -- see `quantize`
+    compression : None | str
+        None | "zstd" | "blosc" -- compression of the encoded bytes
+
+    Returns
+    -------
+    2D array | dict
+        array itself if codec and compression are None, otherwise encoded payload
+    """
+    if codec is None and compression is None:
+        return array
+
+    data, params = quantize(array, codec)
+
+    payload = dict(codec=codec or "", compression=compression or "", shape=data.shape, **params)
+    payload["dtype"] = data.dtype.str
+    payload["data"] = data if compression is None else _compress(data, compression)
+
+    return payload
+
+
+def decode(payload, out=None):
+    """Decodes a [samples, traces] array
+
+    Parameters
+    ----------
+    payload : 2D array | dict
+        array itself | encoded payload
+    out : 2D array | None
+        [samples, traces] -- dtype=float32 -- array that the decoded values are written to, None allocates a new array
+        unless the payload is the array itself
+
+    Returns
+    -------
+    2D array
+        [samples, traces] -- dtype=float -- decoded values
+    """
+    if not isinstance(payload, dict):
+        if out is None:
+            return payload
+        np.copyto(out, payload, casting="same_kind")
+        return out
+
+    codec = payload["codec"] or None
+    compression = payload["compression"] or None
+    shape = tuple(int(_) for _ in payload["shape"])
+    dtype = np.dtype(payload["dtype"])
+
+    data = payload["data"]
+    if compression is not None:
+        data = _decompress(data, compression, dtype, shape)
+
+    return dequantize(data, codec, offset=payload.get("offset"), scale=payload.get("scale"), out=out)
+
+
+# ------- Compression -------
+
+
+def _compress(data, compression):
+    data = np.ascontiguousarray(data)
+
+    if compression == "zstd":
+        import zstandard
+
+        buffer = zstandard.ZstdCompressor().compress(data.tobytes())
+
+    elif compression == "blosc":
+        import blosc
+
+        buffer = blosc.compress(data.tobytes(), typesize=data.dtype.itemsize, shuffle=blosc.SHUFFLE)
+
+    else:
+        raise ValueError(f"compression `{compression}` not recognized")
+
+    return np.frombuffer(buffer, dtype=np.uint8)
+
+
+def _decompress(data, compression, dtype, shape):
+    buffer = np.asarray(data, dtype=np.uint8).tobytes()
+
+    if compression == "zstd":
+        import zstandard
+
+        buffer = zstandard.ZstdDecompressor().decompress(buffer)
+
+    elif compression == "blosc":
+        import blosc
+
+        buffer = blosc.decompress(buffer)
+
+    else:
+        raise ValueError(f"compression `{compression}` not recognized")
+
+    return np.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+# ------- Codec Benchmark -------
+
+
+def benchmark(array, codecs=(None, "float16", "uint16", "uint8"), compressions=(None,), repeats=10):
+    """Compares codecs by storage footprint, in-memory decode latency, and standardized error.
+    Fetch latency from the external store is not measured.
+
+    Parameters
+    ----------
+    array : 2D array
+        [samples, traces] -- dtype=float -- values to encode
+    codecs : Sequence[None | str]
+        codecs, see `encode`
+    compressions : Sequence[None | str]
+        compressions, see `encode`
+    repeats : int
+        number of repeats for timing
+
+    Returns
+    -------
+    pandas.DataFrame
+        codec -- None | str
+        compression -- None | str
+        bytes -- int -- size of the serialized blob
+        ratio -- float -- size relative to the uncompressed float32 blob
+        decode_latency -- float -- seconds to deserialize and decode the blob in memory
+        error -- float -- maximum absolute error, in units of the per-trace standard deviation
+    """
+    import pandas as pd
+    from datajoint.blob import pack, unpack
+
+    array = np.asarray(array, dtype=np.float32)
+    std = np.nanstd(array, axis=0).clip(min=1e-4)
+    base = len(pack(array, compress=False))
+
+    rows = []
+    for codec in codecs:
+        for compression in compressions:
+
+            blob = pack(encode(array, codec, compression))
+
+            start = perf_counter()
+            for _ in range(repeats):
+                decoded = decode(unpack(blob, squeeze=False))
+            decode_latency = (perf_counter() - start) / repeats
+
+            error = np.abs(decoded - array) / std
+            error = np.nanmax(error) if np.isfinite(error).any() else 0.0
+
+            rows.append(
+                dict(
+                    codec=codec,
+                    compression=compression,
+                    bytes=len(blob),
+                    ratio=len(blob) / base,
+                    decode_latency=decode_latency,
+                    error=float(error),
+                )
+            )
+
+    return pd.DataFrame(rows)
@@ -2,6 +2,54 @@ import os
 from contextlib import contextmanager
 
 
+@contextmanager
+def use_environ(name, value):
+    """Context manager that sets an environment variable, restoring its previous state on exit.
+    Settings made this way are inherited by spawned processes.
+
+    Parameters
+    ----------
+    name : str
+        environment variable
+    value : str
+        value of the environment variable
+    """
+    prev = os.getenv(name)
+    os.environ[name] = str(value)
+
+    try:
+        yield
+    finally:
+        if prev is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = prev
+
+
+@contextmanager
+def use_processes(processes):
+    """Context manager that sets the number of worker processes of concurrent computations, e.g. trial resampling
+
+    Parameters
+    ----------
+    processes : int
+        number of worker processes, 1 computes serially
+    """
+    with use_environ("FOUNDATION_PROCESSES", int(processes)):
+        yield
+
+
+def worker_processes():
+    """Number of worker processes of concurrent computations
+
+    Returns
+    -------
+    int
+        number of worker processes, 1 if computations are serial
+    """
+    return max(int(os.getenv("FOUNDATION_PROCESSES", "1")), 1)
+
+
 @contextmanager
 def torch_rng(seed=None):
     """Context manager that forks the torch RNG and optionally sets a manual seed in the forked state
@@ -25,32 +73,38 @@ def torch_rng(seed=None):
 
 
 @contextmanager
-def use_cuda(device=None):
-    """Context manager that explicitly enables cuda usage
+def use_cuda(device=None, threads=0):
+    """Context manager that explicitly enables cuda usage, or cpu usage if device is 'cpu'
 
     Parameters
     ----------
-    device : None | int
-        cuda device
+    device : None | int | str
+        cuda device | 'cpu' -- cpu usage, e.g. model instantiation with the gloo backend
+    threads : int
+        number of torch threads per process if device is 'cpu', 0 divides the available cores among processes
     """
+    from contextlib import nullcontext
     from torch import cuda
 
-    assert cuda.is_available()
+    if device == "cpu":
+        assert int(threads) >= 0
+        env = f"cpu:{int(threads)}"
+        context = nullcontext()
 
-    if device is None:
-        device = cuda.current_device()
     else:
-        device = int(device)
-        assert 0 <= device < cuda.device_count()
+        assert cuda.is_available()
 
-    prev = os.getenv("FOUNDATION_CUDA", "-1")
-    os.environ["FOUNDATION_CUDA"] = str(device)
+        if device is None:
+            device = cuda.current_device()
+        else:
+            device = int(device)
+            assert 0 <= device < cuda.device_count()
 
-    try:
-        with cuda.device(device):
-            yield
-    finally:
-        os.environ["FOUNDATION_CUDA"] = prev
+        env = str(device)
+        context = cuda.device(device)
+
+    with use_environ("FOUNDATION_CUDA", env), context:
+        yield
 
 
 def cuda_enabled():
@@ -67,4 +121,43 @@ def cuda_enabled():
         return False
 
     env = os.getenv("FOUNDATION_CUDA", "-1")
-    return int(env) >= 0
+    return not env.startswith("cpu") and int(env) >= 0
+
+
+def cpu_enabled():
+    """Check if cpu is used for model instantiation -- explicitly enabled with use_cuda('cpu'), or cuda is not available
+
+    Returns
+    -------
+    bool
+        whether cpu is used for model instantiation
+    """
+    from torch import cuda
+
+    if not cuda.is_available():
+        return True
+
+    env = os.getenv("FOUNDATION_CUDA", "-1")
+    return env.startswith("cpu")
+
+
+def cpu_threads(processes=1):
+    """Number of torch threads per process for cpu usage
+
+    Parameters
+    ----------
+    processes : int
+        number of processes sharing the cpu
+
+    Returns
+    -------
+    int
+        number of torch threads per process
+    """
+    env = os.getenv("FOUNDATION_CUDA", "-1")
+    threads = int(env.partition(":")[2] or 0) if env.startswith("cpu") else 0
+
+    if threads > 0:
+        return threads
+    else:
+        return max(1, (os.cpu_count() or 1) // max(1, int(processes)))
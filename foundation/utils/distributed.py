@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from .context import use_environ
+
+
+@contextmanager
+def use_rendezvous(timeout=1800):
+    """Context manager that sets the timeout of distributed process groups
+
+    Parameters
+    ----------
+    timeout : int
+        timeout (seconds) of process group operations
+    """
+    assert int(timeout) > 0
+
+    with use_environ("FOUNDATION_RENDEZVOUS", int(timeout)):
+        yield
+
+
+def rendezvous_timeout():
+    """
+    Returns
+    -------
+    int
+        timeout (seconds) of process group operations
+    """
+    return int(os.getenv("FOUNDATION_RENDEZVOUS") or 1800)
+
+
+@contextmanager
+def rendezvous():
+    """Context manager that provides a rendezvous unique to a group of spawned processes -- a shared file in a private
+    temporary directory, so that concurrent groups on the same host cannot collide on a port
+
+    Yields
+    ------
+    str
+        init method of the process group
+    """
+    tmp = tempfile.mkdtemp(prefix="foundation_rendezvous_")
+    try:
+        yield f"file://{os.path.join(tmp, 'store')}"
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+@contextmanager
+def process_group(rank, size, init_method, backend, timeout=1800):
+    """Context manager that joins a distributed process group and destroys it on exit
+
+    Parameters
+    ----------
+    rank : int
+        distributed rank
+    size : int
+        distributed size
+    init_method : str
+        init method of the process group, see `rendezvous`
+    backend : str
+        'nccl' | 'mpi' | 'gloo' | 'ucc'
+    timeout : int
+        timeout (seconds) of process group operations
+    """
+    from datetime import timedelta
+    from torch.distributed import init_process_group, destroy_process_group, is_initialized
+
+    init_process_group(
+        backend=backend,
+        init_method=init_method,
+        rank=rank,
+        world_size=size,
+        timeout=timedelta(seconds=timeout),
+    )
+
+    try:
+        yield
+    finally:
+        if is_initialized():
+            destroy_process_group()
@@ -0,0 +1,250 @@
+import os
+import numpy as np
+from collections import OrderedDict
+from threading import Lock
+from functools import partial
+from contextlib import contextmanager
+from .context import use_environ
+
+
+class TrialLoader:
+    """Loads trials on demand -- keeps a bounded LRU of loaded trials and prefetches upcoming trials, i.e. the
+    scheduled trials (see `schedule`), or the trials that follow the last requested trial if there is no schedule"""
+
+    def __init__(self, load, keys, shape, dtype, size=256, prefetch=0, workers=2):
+        """
+        Parameters
+        ----------
+        load : Callable[[Sequence[object]], Iterable[ND array]]
+            loads trials for a sequence of trial keys
+        keys : Sequence[object]
+            trial keys, in dataset order
+        shape : Sequence[int]
+            shape of each sample of a trial, i.e. the trial shape without its first dimension
+        dtype : numpy.dtype
+            data type of the trials
+        size : int
+            maximum number of loaded trials that are kept
+        prefetch : int
+            number of upcoming trials that are loaded in the background, in a single call
+        workers : int
+            number of background threads for prefetching
+        """
+        self.load = load
+        self.keys = list(keys)
+        self.shape = tuple(int(_) for _ in shape)
+        self.dtype = np.dtype(dtype)
+        self.size = int(size)
+        self.prefetch = int(prefetch)
+        self.workers = int(workers)
+
+        self._trials = OrderedDict()
+        self._pending = dict()
+        self._order = []
+        self._position = 0
+        self._last = None
+        self._lock = Lock()
+        self._executor = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _load(self, indexes):
+        trials = list(self.load([self.keys[i] for i in indexes]))
+        assert len(trials) == len(indexes), "Loaded trials do not match the requested trials"
+        return dict(zip(indexes, trials))
+
+    def _store(self, trials):
+        with self._lock:
+            for index, trial in trials.items():
+                self._trials[index] = trial
+                self._trials.move_to_end(index)
+                self._pending.pop(index, None)
+
+            # least recently used trials are evicted first, upcoming trials last
+            upcoming = set(self._upcoming())
+
+            while len(self._trials) > self.size:
+                evict = next((i for i in self._trials if i not in upcoming), next(iter(self._trials)))
+                del self._trials[evict]
+
+    def schedule(self, indexes):
+        """Schedules the order in which trials are going to be requested, e.g. the indexes drawn by a sampler.
+        After each request, the following `prefetch` trials of the schedule are loaded in the background.
+
+        Parameters
+        ----------
+        indexes : Iterable[int]
+            trial indexes, in the order they are going to be requested
+        """
+        with self._lock:
+            self._order = [int(_) for _ in indexes]
+            self._position = 0
+
+        if self.prefetch > 0:
+            self._prefetch()
+
+    def _upcoming(self):
+        # the next scheduled trials, or the trials that follow the last requested trial in dataset order
+        if self._order:
+            return self._order[self._position : self._position + self.prefetch]
+
+        elif self._last is None:
+            return []
+
+        else:
+            return list(range(self._last + 1, min(self._last + 1 + self.prefetch, len(self.keys))))
+
+    def _advance(self, index):
+        # move past the requested index in the schedule, if it is scheduled
+        with self._lock:
+            try:
+                self._position = self._order.index(index, self._position) + 1
+            except ValueError:
+                pass
+
+    def _prefetch(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._lock:
+            # upcoming trials that are neither loaded nor pending
+            indexes = [i for i in dict.fromkeys(self._upcoming()) if i not in self._trials and i not in self._pending]
+
+            if not indexes:
+                return
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+            future = self._executor.submit(self._load, indexes)
+
+            for i in indexes:
+                self._pending[i] = future
+
+        future.add_done_callback(partial(self._done, indexes))
+
+    def _done(self, indexes, future):
+        if future.exception() is None:
+            self._store(future.result())
+        else:
+            with self._lock:
+                for i in indexes:
+                    self._pending.pop(i, None)
+
+    def __getitem__(self, index):
+        """
+        Parameters
+        ----------
+        index : int
+            trial index
+
+        Returns
+        -------
+        ND array
+            loaded trial
+        """
+        with self._lock:
+            trial = self._trials.get(index)
+            pending = self._pending.get(index)
+            self._last = index
+
+            if trial is not None:
+                self._trials.move_to_end(index)
+
+        if trial is None:
+            trials = self._load([index]) if pending is None else pending.result()
+            trial = trials[index]
+            self._store({index: trial})
+
+        if self._order:
+            self._advance(index)
+
+        if self.prefetch > 0:
+            self._prefetch()
+
+        return trial
+
+    def handles(self, lengths):
+        """
+        Parameters
+        ----------
+        lengths : Sequence[int]
+            number of samples per trial
+
+        Returns
+        -------
+        List[TrialHandle]
+            handles to the trials
+        """
+        return [TrialHandle(self, i, n) for i, n in enumerate(lengths)]
+
+
+class TrialHandle:
+    """Handle to a trial that is loaded on access"""
+
+    __slots__ = ["loader", "index", "length"]
+
+    def __init__(self, loader, index, length):
+        """
+        Parameters
+        ----------
+        loader : TrialLoader
+            trial loader
+        index : int
+            trial index
+        length : int
+            number of samples
+        """
+        self.loader = loader
+        self.index = int(index)
+        self.length = int(length)
+
+    def __len__(self):
+        return self.length
+
+    def load(self):
+        """
+        Returns
+        -------
+        ND array
+            loaded trial
+        """
+        return self.loader[self.index]
+
+    @property
+    def shape(self):
+        return (self.length, *self.loader.shape)
+
+    @property
+    def dtype(self):
+        return self.loader.dtype
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.load(), dtype=dtype)
+
+
+@contextmanager
+def use_lazy_dataset(size=256):
+    """Context manager that enables lazily loaded datasets
+
+    Parameters
+    ----------
+    size : int
+        maximum number of loaded trials kept per data stream, 0 disables lazy loading
+    """
+    with use_environ("FOUNDATION_LAZY", int(size)):
+        yield
+
+
+def lazy_size():
+    """Maximum number of loaded trials kept per data stream of lazily loaded datasets
+
+    Returns
+    -------
+    int
+        maximum number of loaded trials, 0 if lazy loading is disabled
+    """
+    return int(os.getenv("FOUNDATION_LAZY", "0"))
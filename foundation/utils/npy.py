@@ -0,0 +1,81 @@
+import os
+import numpy as np
+from uuid import uuid4
+from contextlib import contextmanager
+
+
+def save(path, array):
+    """Saves an array to an npy file, atomically replacing any existing file
+
+    Parameters
+    ----------
+    path : str
+        npy file path
+    array : ND array
+        array to save
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{uuid4().hex}.tmp"
+
+    try:
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+
+        os.replace(tmp, path)
+
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+@contextmanager
+def create(path, shape, dtype=np.float32):
+    """Context manager that creates a memory-mapped npy file, atomically replacing any existing file on exit
+
+    Parameters
+    ----------
+    path : str
+        npy file path
+    shape : Sequence[int]
+        array shape
+    dtype : np.dtype
+        array dtype
+
+    Yields
+    ------
+    np.memmap
+        writable memory-mapped array
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{uuid4().hex}.tmp"
+
+    try:
+        array = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=tuple(shape))
+        yield array
+
+        array.flush()
+        del array
+
+        os.replace(tmp, path)
+
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load(path, mmap=True):
+    """Loads an array from an npy file
+
+    Parameters
+    ----------
+    path : str
+        npy file path
+    mmap : bool
+        memory-mapped (read-only) | loaded into memory
+
+    Returns
+    -------
+    ND array
+        loaded array
+    """
+    return np.load(path, mmap_mode="r" if mmap else None)
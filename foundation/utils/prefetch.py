@@ -0,0 +1,119 @@
+import os
+from queue import Queue, Full
+from threading import Thread, Event, RLock
+from contextlib import contextmanager
+from .context import use_environ
+
+
+# lock that serializes database access across prefetching threads
+fetch_lock = RLock()
+
+
+def locked_fetch(query, *attrs):
+    """Fetches attributes of a query while holding `fetch_lock`, so that concurrent loaders share the connection
+
+    Parameters
+    ----------
+    query : datajoint.expression.QueryExpression
+        query to fetch
+    *attrs : str
+        attributes to fetch
+
+    Returns
+    -------
+    list[Sequence]
+        values of each attribute, in the order of `attrs`
+    """
+    with fetch_lock:
+        values = query.fetch(*attrs)
+
+    return list(values) if len(attrs) > 1 else [values]
+
+
+class _Error:
+    def __init__(self, error):
+        self.error = error
+
+
+_done = object()
+
+
+def prefetch(iterable, size=1):
+    """Iterates over an iterable in a background thread, buffering up to `size` items ahead of the consumer
+
+    Parameters
+    ----------
+    iterable : Iterable
+        iterable to prefetch
+    size : int
+        maximum number of items buffered ahead
+
+    Yields
+    ------
+    object
+        items of the iterable, in order
+    """
+    queue = Queue(maxsize=max(int(size), 1))
+    stop = Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def worker():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(_done)
+
+        except BaseException as error:
+            put(_Error(error))
+
+    thread = Thread(target=worker, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = queue.get()
+
+            if item is _done:
+                return
+
+            if isinstance(item, _Error):
+                raise item.error
+
+            yield item
+
+    finally:
+        stop.set()
+        thread.join()
+
+
+@contextmanager
+def use_prefetch(size):
+    """Context manager that sets the number of items prefetched ahead by concurrent loaders
+
+    Parameters
+    ----------
+    size : int
+        number of items prefetched ahead, 0 disables prefetching
+    """
+    with use_environ("FOUNDATION_PREFETCH", int(size)):
+        yield
+
+
+def prefetch_size():
+    """Number of items prefetched ahead by concurrent loaders
+
+    Returns
+    -------
+    int
+        number of items prefetched ahead, 0 if prefetching is disabled
+    """
+    return int(os.getenv("FOUNDATION_PREFETCH", "0"))
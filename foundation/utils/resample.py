@@ -1,5 +1,7 @@
 import numpy as np
+from functools import partial
 from scipy.interpolate import interp1d
+from scipy.ndimage import convolve1d
 from scipy.signal import windows
 
 
@@ -36,14 +38,25 @@ def fill_nans(trace):
 
     Parameters
     ----------
-    trace : 1D array
-        values with nans
+    trace : 1D array | 2D array
+        [time] | [time, traces] -- values with nans
 
     Returns
     -------
-    1D trace
-        trace with interpolated nans
+    1D array | 2D array
+        [time] | [time, traces] -- trace(s) with interpolated nans
     """
+    if trace.ndim == 2:
+        nan = np.isnan(trace).any(axis=0)
+        if not nan.any():
+            return trace
+
+        out = trace.copy()
+        for i in np.flatnonzero(nan):
+            out[:, i] = fill_nans(trace[:, i])
+
+        return out
+
     nan = np.isnan(trace)
     if nan.all():
         raise ValueError("Cannot fill when all values are nan.")
@@ -57,6 +70,74 @@ def fill_nans(trace):
     return out
 
 
+def hamming(trace, size):
+    """Smooths with a normalized hamming window
+
+    Parameters
+    ----------
+    trace : 1D array | 2D array
+        [time] | [time, traces] -- values to smooth
+    size : int
+        half-width of the hamming window
+
+    Returns
+    -------
+    1D array | 2D array
+        [time] | [time, traces] -- smoothed trace(s)
+    """
+    h = windows.hamming(size * 2 + 1)
+    f = h / h.sum()
+
+    if trace.ndim == 1:
+        return np.convolve(trace, f, mode="same")
+    else:
+        return convolve1d(trace, f, axis=0, output=np.result_type(trace, f), mode="constant")
+
+
+def interpolate(x, xp, fp):
+    """Linear interpolation, nan outside of the bounds of the sample points
+
+    Parameters
+    ----------
+    x : 1D array | 2D array
+        [samples] | [samples, traces] -- points to evaluate
+    xp : 1D array
+        [points] -- sample points, monotonically increasing
+    fp : 1D array | 2D array
+        [points] | [points, traces] -- sample values
+
+    Returns
+    -------
+    1D array | 2D array
+        [samples] | [samples, traces] -- interpolated values
+    """
+    if not np.issubdtype(fp.dtype, np.inexact):
+        fp = fp.astype(float)
+
+    if fp.ndim == 2 and x.ndim == 1:
+        x = x[:, None]
+
+    # neighboring sample points
+    hi = np.searchsorted(xp, x).clip(1, xp.size - 1)
+    lo = hi - 1
+
+    if fp.ndim == 2:
+        columns = np.arange(fp.shape[1])
+        y_lo = fp[lo, columns]
+        y_hi = fp[hi, columns]
+    else:
+        y_lo = fp[lo]
+        y_hi = fp[hi]
+
+    # linear interpolation
+    x_lo = xp[lo]
+    x_hi = xp[hi]
+    y = (y_hi - y_lo) / (x_hi - x_lo) * (x - x_lo) + y_lo
+
+    # out of bounds
+    return np.where((x < xp[0]) | (x > xp[-1]), np.nan, y)
+
+
 def monotonic(trace):
     """Determines if trace monotonically increases
 
@@ -172,19 +253,25 @@ class Resample:
         Parameters
         -------
         times : 1D array
-            trace times, monotonically increasing
-        values : 1D array
-            trace values, same length as times
+            [time] -- trace times, monotonically increasing
+        values : 1D array | 2D array
+            [time] | [time, traces] -- trace values, same length as times
         target_period : float
             target sampling period
-        target_offset : float
-            target sampling offset
+        target_offset : float | 1D array
+            target sampling offset | [traces] -- target sampling offset of each trace
         """
-        if not times.ndim == values.ndim == 1:
-            raise ValueError("Times and Values must be 1D")
+        if times.ndim != 1:
+            raise ValueError("Times must be 1D")
+
+        if values.ndim not in [1, 2]:
+            raise ValueError("Values must be 1D or 2D")
+
+        if times.size != len(values):
+            raise ValueError("Times and Values are not the same length")
 
-        if times.size != values.size:
-            raise ValueError("Times and Values are not the same size")
+        if np.ndim(target_offset) and (values.ndim != 2 or np.size(target_offset) != values.shape[1]):
+            raise ValueError("Target offset does not match the number of traces")
 
         if not monotonic(times):
             raise ValueError("Times do not monotonically increase.")
@@ -193,19 +280,13 @@ class Resample:
         self.values = values
 
         self.median_time = np.nanmedian(times)
-        self.median_value = np.nanmedian(values)
+        self.median_value = np.nanmedian(values, axis=0)
 
         self.source_period = np.nanmedian(np.diff(times))
         self.target_period = target_period
         self.target_offset = target_offset
 
-        self.interp = interp1d(
-            x=self.x,
-            y=self.y,
-            kind=self.kind,
-            bounds_error=False,
-            fill_value=np.nan,
-        )
+        self.interp = partial(interpolate, xp=self.x, fp=self.y)
 
     @property
     def x(self):
@@ -215,10 +296,6 @@ class Resample:
     def y(self):
         return self.transform_values(self.values)
 
-    @property
-    def kind(self):
-        return "linear"
-
     @property
     def dtype(self):
         return np.float32
@@ -246,15 +323,18 @@ class Resample:
 
         Returns
         -------
-        1D array
-            target values
+        1D array | 2D array
+            [samples] | [samples, traces] -- target values
         """
         x = sample_times(
             start=self.transform_times(start),
             end=self.transform_times(end),
             period=self.target_period,
         )
-        x = x + self.target_offset
+        if np.ndim(self.target_offset):
+            x = x[:, None] + self.target_offset
+        else:
+            x = x + self.target_offset
         y = self.transform_values(
             values=self.interp(x),
             inverse=True,
@@ -271,7 +351,7 @@ class Nans(Resample):
 
     @property
     def y(self):
-        return np.isnan(self.times) | np.isnan(self.values)
+        return (np.isnan(self.values).T | np.isnan(self.times)).T
 
     def transform_values(self, values, inverse=False):
         if inverse:
@@ -289,9 +369,7 @@ class Hamming(Resample):
 
         if self.target_period > self.source_period:
             r = round(self.target_period / self.source_period)
-            h = windows.hamming(r * 2 + 1)
-            f = h / h.sum()
-            y = np.convolve(y, f, mode="same")
+            y = hamming(y, r)
 
         return y
 
@@ -304,15 +382,15 @@ class LowpassHamming(Resample):
         Parameters
         -------
         times : 1D array
-            trace times, monotonically increasing
-        values : 1D array
-            trace values, same length as times
+            [time] -- trace times, monotonically increasing
+        values : 1D array | 2D array
+            [time] | [time, traces] -- trace values, same length as times
         target_period : float
             target sampling period
         lowpass_period : float
             lowpass filter period
-        target_offset : float
-            target sampling offset
+        target_offset : float | 1D array
+            target sampling offset | [traces] -- target sampling offset of each trace
         """
         self.lowpass_period = lowpass_period
 
@@ -324,8 +402,6 @@ class LowpassHamming(Resample):
 
         if self.lowpass_period > self.source_period:
             r = round(self.lowpass_period / self.source_period)
-            h = windows.hamming(r * 2 + 1)
-            f = h / h.sum()
-            y = np.convolve(y, f, mode="same")
+            y = hamming(y, r)
 
         return y
@@ -1,34 +1,65 @@
 import numpy as np
-import pandas as pd
-from scipy import stats
-from .resample import truncate
 
 
 # ---------------------------- Response Trials ----------------------------
 
 
-class Trials(pd.Series):
-    """Response Trials"""
+class Trials:
+    """Response Trials -- ragged trial responses stored in a single flat buffer"""
 
     def __init__(self, data, index=None, tolerance=0):
         """
         Parameters
         ----------
-        data : Sequence[1D array]
-            trial responses
+        data : Iterable[1D array | 2D array]
+            trial responses -- [samples] | [samples, units]
         index : Sequence[str] | None
             trial identifiers. optional if len(data) == 1
-        tolerance : int
-            response length mismatch tolerance
+        tolerance : int | None
+            response length mismatch tolerance. if None, responses are not truncated to the same length
         """
-        # truncate trial responses to the same length
-        data = truncate(*data, tolerance=tolerance)
+        # trial response lengths
+        data = list(data)
+        lengths = np.array([len(_) for _ in data], dtype=int)
+
+        if tolerance is not None and lengths.size:
+            # truncate trial responses to the same length
+            if lengths.max() - lengths.min() > tolerance:
+                raise ValueError(f"Responses differ in length by more than {tolerance}")
+            lengths[:] = lengths.min()
+
+        # trial offsets into the flat buffer
+        self.offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+        # flat buffer -- [total samples] | [total samples, units]
+        shape = {_.shape[1:] for _ in data}
+        assert len(shape) <= 1, "Responses must have the same number of units."
+        shape = shape.pop() if shape else ()
+
+        if data:
+            self.buffer = np.concatenate([trial[:n] for trial, n in zip(data, lengths)], axis=0)
+        else:
+            self.buffer = np.empty([0, *shape], dtype=float)
+
+        # trial identifiers
+        self.index = [None] if index is None else list(index)
+        assert len(self.index) == len(lengths), "Trial identifiers must match the number of responses."
+
+    def __len__(self):
+        return len(self.index)
 
-        # assert all responses are 1D
-        assert all(map(lambda x: x.ndim == 1, data)), "Each response must be 1D."
+    def __getitem__(self, i):
+        return self.buffer[self.offsets[i] : self.offsets[i + 1]]
 
-        # initialize
-        super().__init__(data=data, index=[None] if index is None else index)
+    @property
+    def lengths(self):
+        """
+        Returns
+        -------
+        1D array
+            [trials] -- number of samples per trial
+        """
+        return np.diff(self.offsets)
 
     def to_array(self, size=None):
         """
@@ -39,20 +70,25 @@ class Trials(pd.Series):
 
         Returns
         -------
-        2D array
-            [trials, samples], nan-filled to desired trial size
+        2D array | 3D array
+            [trials, samples] | [trials, samples, units], nan-filled to desired trial size
         """
-        # 2D response array
-        array = np.stack(self.values, axis=0)
-        trials, samples = array.shape
+        lengths = self.lengths
+        if lengths.size and lengths.min() != lengths.max():
+            raise ValueError("Responses must have the same length.")
+
+        # response array, a view of the buffer
+        trials = len(self)
+        samples = lengths[0] if lengths.size else 0
+        array = self.buffer.reshape(trials, samples, *self.buffer.shape[1:])
 
         if size is None or size == trials:
             # response array
             return array
 
-        elif size > array.shape[0]:
+        elif size > trials:
             # nan-filled response array
-            nans = np.full([size - trials, samples], np.nan, dtype=array.dtype)
+            nans = np.full([size - trials, *array.shape[1:]], np.nan, dtype=array.dtype)
             return np.concatenate([array, nans], axis=0)
 
         else:
@@ -70,28 +106,35 @@ class Trials(pd.Series):
         bool
             whether trial identifiers and response lengths match
         """
-        return [*self.index, self.iloc[0].size] == [*other.index, other.iloc[0].size]
+        return self.index == other.index and np.array_equal(self.lengths, other.lengths)
 
 
 def concatenate(*trials, burnin=0):
     """
     Parameters
     ----------
-    *trials : Trials
-        trial responses to concatenate
+    *trials : Trials | 2D array | 3D array
+        trial responses to concatenate -- Trials | [trials, samples] | [trials, samples, units]
     burnin : int
         number of initial frames to discard
 
     Returns
     -------
-    2D array
-        [trials, samples]
+    2D array | 3D array
+        [trials, samples] | [trials, samples, units]
     """
     # max response trials
     size = max(map(len, trials))
 
     # convert responses to arrays, filling missing trials with NaNs
-    arrays = [r.to_array(size)[:, burnin:] for r in trials]
+    arrays = []
+    for r in trials:
+        if isinstance(r, Trials):
+            r = r.to_array(size)
+        elif len(r) < size:
+            nans = np.full([size - len(r), *r.shape[1:]], np.nan, dtype=r.dtype)
+            r = np.concatenate([r, nans], axis=0)
+        arrays.append(r[:, burnin:])
 
     # concatenate along samples dimensions
     return np.concatenate(arrays, axis=1)
@@ -109,13 +152,13 @@ class Measure:
         """
         Parameters
         ----------
-        x : 2D array
-            [trials, samples]
+        x : 2D array | 3D array
+            [trials, samples] | [trials, samples, units]
 
         Returns
         -------
-        float
-            functional measure
+        float | 1D array
+            functional measure | [units] -- functional measures
         """
         raise NotImplementedError()
 
@@ -128,14 +171,14 @@ class CCMax(Measure):
 
     def __call__(self, x):
         # number of trials per sample
-        trials, samples = x.shape
+        trials, samples = x.shape[:2]
         t = trials - np.isnan(x).sum(axis=0)
 
         # pooled variance -> n
         v = 1 / t**2
         w = t - 1
-        z = t.sum() - samples
-        n = np.sqrt(z / (w * v).sum())
+        z = t.sum(axis=0) - samples
+        n = np.sqrt(z / (w * v).sum(axis=0))
 
         # response mean
         y_m = np.nanmean(x, axis=0)
@@ -164,15 +207,15 @@ class Correlation:
         """
         Parameters
         ----------
-        x : 2D array
-            [trials, samples]
-        y : 2D array
-            [trials, samples]
+        x : 2D array | 3D array
+            [trials, samples] | [trials, samples, units]
+        y : 2D array | 3D array
+            [trials, samples] | [trials, samples, units]
 
         Returns
         -------
-        float
-            functional measure
+        float | 1D array
+            functional measure | [units] -- functional measures
         """
         raise NotImplementedError()
 
@@ -184,6 +227,14 @@ class CCSignal(Correlation):
     """Signal Correlation"""
 
     def __call__(self, x, y):
+        # trial means
         x = np.nanmean(x, axis=0)
         y = np.nanmean(y, axis=0)
-        return stats.pearsonr(x, y)[0]
+
+        # centered trial means
+        x = x - x.mean(axis=0)
+        y = y - y.mean(axis=0)
+
+        # pearson correlation along samples
+        r = (x * y).sum(axis=0) / np.sqrt((x * x).sum(axis=0) * (y * y).sum(axis=0))
+        return np.clip(r, -1, 1)
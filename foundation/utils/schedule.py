@@ -0,0 +1,157 @@
+import os
+import sys
+import time
+import multiprocessing as mp
+from foundation.utils import logger
+
+
+class Job:
+    """Job that is run in a separate process"""
+
+    def __init__(self, name, target, args=(), cores=1, memory=0, devices=0, env=None):
+        """
+        Parameters
+        ----------
+        name : str
+            job name, unique among the scheduled jobs
+        target : Callable
+            function that runs the job -- must be importable by a spawned process
+        args : Sequence
+            arguments of the function
+        cores : int
+            number of cpu cores required
+        memory : float
+            memory required (GB)
+        devices : int
+            number of cuda devices required
+        env : dict[str, str] | None
+            environment variables of the job process
+        """
+        self.name = str(name)
+        self.target = target
+        self.args = tuple(args)
+        self.cores = int(cores)
+        self.memory = float(memory)
+        self.devices = int(devices)
+        self.env = dict(env or {})
+
+
+def _run(target, args, env, log):
+    # job environment
+    os.environ.update(env)
+
+    # redirect output, inherited by processes spawned by the job
+    if log is not None:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        fd = os.open(log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        os.close(fd)
+
+    target(*args)
+
+
+def total_memory():
+    """
+    Returns
+    -------
+    float
+        physical memory of the host (GB)
+    """
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 1e9
+
+
+def pack(jobs, cores=None, memory=None, devices=None, log_dir=None, poll=1.0):
+    """Runs jobs concurrently as separate processes, packing them within a resource budget.
+    Jobs are started in order, and later jobs are started ahead of a waiting job if they fit into the free resources.
+
+    Parameters
+    ----------
+    jobs : Sequence[Job]
+        jobs to run
+    cores : int | None
+        cpu cores available to the jobs, None uses all cores of the host
+    memory : float | None
+        memory available to the jobs (GB), None uses the physical memory of the host
+    devices : Sequence[int] | None
+        cuda devices available to the jobs, assigned to each job via CUDA_VISIBLE_DEVICES
+    log_dir : str | None
+        directory of per-job log files ({name}.log), None keeps the output of the jobs in the calling process
+    poll : float
+        polling interval (seconds) for finished jobs
+
+    Returns
+    -------
+    dict[str, int]
+        job name -> exit code
+    """
+    cores = os.cpu_count() if cores is None else int(cores)
+    memory = total_memory() if memory is None else float(memory)
+    devices = [] if devices is None else [int(_) for _ in devices]
+
+    # verify jobs
+    assert len({job.name for job in jobs}) == len(jobs), "Job names are not unique"
+
+    for job in jobs:
+        if job.cores > cores or job.memory > memory or job.devices > len(devices):
+            raise ValueError(f"Job `{job.name}` exceeds the resource budget")
+
+    if log_dir is not None:
+        os.makedirs(log_dir, exist_ok=True)
+
+    ctx = mp.get_context("spawn")
+    pending = list(jobs)
+    running = dict()
+    codes = dict()
+
+    while pending or running:
+
+        # release resources of finished jobs
+        for name, (process, job, _devices) in list(running.items()):
+
+            if process.is_alive():
+                continue
+
+            process.join()
+            codes[name] = process.exitcode
+
+            cores += job.cores
+            memory += job.memory
+            devices = sorted(devices + _devices)
+
+            del running[name]
+
+            if process.exitcode:
+                logger.warning(f"Job `{name}` failed with exit code {process.exitcode}")
+            else:
+                logger.info(f"Job `{name}` finished")
+
+        # start jobs that fit into the free resources
+        for job in list(pending):
+
+            if job.cores > cores or job.memory > memory or job.devices > len(devices):
+                continue
+
+            _devices, devices = devices[: job.devices], devices[job.devices :]
+            cores -= job.cores
+            memory -= job.memory
+
+            env = dict(job.env)
+            if _devices:
+                env["CUDA_VISIBLE_DEVICES"] = ",".join(str(_) for _ in _devices)
+
+            log = None if log_dir is None else os.path.join(log_dir, f"{job.name}.log")
+
+            process = ctx.Process(target=_run, args=(job.target, job.args, env, log), name=job.name)
+            process.start()
+
+            running[job.name] = process, job, _devices
+            pending.remove(job)
+
+            logger.info(f"Job `{job.name}` started -- {len(running)} running, {len(pending)} pending")
+
+        if running:
+            time.sleep(poll)
+
+    return {job.name: codes[job.name] for job in jobs}
@@ -1,4 +1,5 @@
 import numpy as np
+from copy import copy
 
 
 # ------- Standardize Interface -------
@@ -7,6 +8,8 @@ import numpy as np
 class Standardize:
     """Standardize Base"""
 
+    columns = []
+
     def __init__(self, homogeneous):
         """
         Parameters
@@ -15,12 +18,13 @@ class Standardize:
             [N] -- dtype=bool -- homogeneous | unrestricted transform
         """
         self.homogeneous = np.array(homogeneous, dtype=bool)
+        self.index = None
         assert self.homogeneous.ndim == 1
 
     def __len__(self):
         return self.homogeneous.size
 
-    def __call__(self, a, inverse=False):
+    def __call__(self, a, inverse=False, out=None):
         """
         Parameters
         ----------
@@ -28,14 +32,72 @@ class Standardize:
             [M, N] -- dtype=float -- values to be transformed
         inverse : bool
             inverse | normal transform
+        out : 2D array | None
+            [M, N] -- dtype=float -- array that the transformed values are written to, may be `a` itself,
+            values are cast to the dtype of `out` -- if None, a new array of the same float dtype as `a` is allocated
 
         Returns
         -------
         2D array
             [M, N] -- dtype=float -- transformed values
         """
+        a = np.asarray(a)
+        index = None if inverse else self.index
+
+        if out is None:
+            dtype = a.dtype if a.dtype.kind == "f" else float
+            size = a.shape[1] if index is None else index.size
+            out = np.empty([a.shape[0], size], dtype=dtype)
+
+        # reorder columns into the output
+        if index is not None and a.dtype == out.dtype:
+            np.take(a, index, axis=1, out=out)
+        elif index is not None:
+            np.copyto(out, np.take(a, index, axis=1), casting="same_kind")
+        elif out is not a:
+            np.copyto(out, a, casting="same_kind")
+
+        # transform the output in place
+        self._transform(out, inverse=inverse)
+
+        return out
+
+    def _transform(self, a, inverse=False):
+        """
+        Parameters
+        ----------
+        a : 2D array
+            [M, N] -- dtype=float -- values to be transformed in place
+        inverse : bool
+            inverse | normal transform
+        """
         raise NotImplementedError()
 
+    def reorder(self, index):
+        """
+        Parameters
+        ----------
+        index : 1D array
+            [N'] -- dtype=int -- column indices
+
+        Returns
+        -------
+        Standardize
+            transform that selects and reorders columns ([M, N] -> [M, N']) while standardizing,
+            the inverse transform operates on the reordered columns
+        """
+        index = np.array(index, dtype=int)
+        assert index.ndim == 1
+
+        other = copy(self)
+        other.homogeneous = self.homogeneous[index]
+        other.index = index if self.index is None else self.index[index]
+
+        for column in self.columns:
+            setattr(other, column, getattr(self, column)[index])
+
+        return other
+
 
 # ------- Standardize Types -------
 
@@ -43,6 +105,8 @@ class Standardize:
 class Affine(Standardize):
     """Affine Transform"""
 
+    columns = ["shift", "scale"]
+
     def __init__(self, shift, scale, homogeneous, eps=1e-4):
         """
         Parameters
@@ -65,16 +129,23 @@ class Affine(Standardize):
         assert self.shift.ndim == self.scale.ndim == 1
         assert self.shift.size == self.scale.size == len(self)
 
-    def __call__(self, a, inverse=False):
+    def _transform(self, a, inverse=False):
+        shift = self.shift.astype(a.dtype, copy=False)
+        scale = self.scale.astype(a.dtype, copy=False)
+
         if inverse:
-            return a * self.scale + self.shift
+            np.multiply(a, scale, out=a)
+            np.add(a, shift, out=a)
         else:
-            return (a - self.shift) / self.scale
+            np.subtract(a, shift, out=a)
+            np.divide(a, scale, out=a)
 
 
 class Scale(Standardize):
     """Scale Transform"""
 
+    columns = ["scale"]
+
     def __init__(self, scale, homogeneous, eps=1e-4):
         """
         Parameters
@@ -94,8 +165,10 @@ class Scale(Standardize):
         assert self.scale.ndim == 1
         assert self.scale.size == len(self)
 
-    def __call__(self, a, inverse=False):
+    def _transform(self, a, inverse=False):
+        scale = self.scale.astype(a.dtype, copy=False)
+
         if inverse:
-            return a * scale
+            np.multiply(a, scale, out=a)
         else:
-            return a / self.scale
+            np.divide(a, scale, out=a)
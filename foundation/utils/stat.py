@@ -0,0 +1,320 @@
+import numpy as np
+
+
+# ------- Accumulator Interface -------
+
+
+class Accumulator:
+    """Streaming Summary Statistic"""
+
+    def update(self, x):
+        """
+        Parameters
+        ----------
+        x : 1D array | 2D array
+            [samples] | [samples, traces] -- values to accumulate
+
+        Returns
+        -------
+        Accumulator
+            self, updated with the values
+        """
+        raise NotImplementedError()
+
+    def merge(self, other):
+        """
+        Parameters
+        ----------
+        other : Accumulator
+            accumulator of the same type, updated with a disjoint set of values
+
+        Returns
+        -------
+        Accumulator
+            self, merged with the other accumulator
+        """
+        raise NotImplementedError()
+
+    @property
+    def value(self):
+        """
+        Returns
+        -------
+        float | 1D array
+            summary statistic | [traces] -- summary statistics
+        """
+        raise NotImplementedError()
+
+
+# ------- Accumulator Types -------
+
+
+class Minimum(Accumulator):
+    """Running Minimum"""
+
+    def __init__(self):
+        self.minimum = None
+
+    def update(self, x):
+        if len(x):
+            m = np.min(x, axis=0)
+            self.minimum = m if self.minimum is None else np.minimum(self.minimum, m)
+
+        return self
+
+    def merge(self, other):
+        if other.minimum is not None:
+            self.minimum = other.minimum if self.minimum is None else np.minimum(self.minimum, other.minimum)
+
+        return self
+
+    @property
+    def value(self):
+        return np.nan if self.minimum is None else self.minimum
+
+
+class Mean(Accumulator):
+    """Running Mean"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+
+    def _merge(self, count, mean):
+        total = self.count + count
+        self.mean = self.mean + (mean - self.mean) * (count / total)
+        self.count = total
+
+    def update(self, x):
+        if len(x):
+            self._merge(len(x), np.mean(x, axis=0, dtype=np.float64))
+
+        return self
+
+    def merge(self, other):
+        if other.count:
+            self._merge(other.count, other.mean)
+
+        return self
+
+    @property
+    def value(self):
+        return self.mean if self.count else np.nan
+
+
+class Std(Accumulator):
+    """Running Standard Deviation -- Welford's algorithm, merged with Chan's parallel update"""
+
+    def __init__(self, ddof=0):
+        """
+        Parameters
+        ----------
+        ddof : int
+            delta degrees of freedom
+        """
+        self.ddof = int(ddof)
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _merge(self, count, mean, m2):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + delta**2 * (self.count * count / total)
+        self.count = total
+
+    def update(self, x):
+        if len(x):
+            mean = np.mean(x, axis=0, dtype=np.float64)
+            m2 = np.sum(np.square(x - mean), axis=0)
+            self._merge(len(x), mean, m2)
+
+        return self
+
+    def merge(self, other):
+        if other.ddof != self.ddof:
+            raise ValueError("Cannot merge accumulators with different ddof")
+
+        if other.count:
+            self._merge(other.count, other.mean, other.m2)
+
+        return self
+
+    @property
+    def value(self):
+        if self.count > self.ddof:
+            return np.sqrt(self.m2 / (self.count - self.ddof))
+        else:
+            return np.nan
+
+
+class Quantile(Accumulator):
+    """Exact Quantile -- retains all accumulated values, so memory is unbounded and grows with the number of samples.
+    Use QuantileSketch for bounded memory.
+    """
+
+    def __init__(self, q):
+        """
+        Parameters
+        ----------
+        q : float
+            quantile, between 0 and 1
+        """
+        self.q = float(q)
+        self.values = []
+
+    def update(self, x):
+        if len(x):
+            self.values.append(np.asarray(x))
+
+        return self
+
+    def merge(self, other):
+        if other.q != self.q:
+            raise ValueError("Cannot merge accumulators of different quantiles")
+
+        self.values.extend(other.values)
+
+        return self
+
+    @property
+    def value(self):
+        if self.values:
+            return np.quantile(np.concatenate(self.values), self.q, axis=0)
+        else:
+            return np.nan
+
+
+class QuantileSketch(Accumulator):
+    """Approximate Quantile -- mergeable compactor sketch (KLL-style) with bounded memory
+
+    Values are inserted into level 0. Whenever a level exceeds its capacity, its values are sorted and every other
+    value, starting at a random offset, is promoted to the next level, where each value carries twice the weight.
+    The memory per trace is bounded by capacity * log2(samples / capacity).
+    """
+
+    def __init__(self, q, capacity=256, seed=0):
+        """
+        Parameters
+        ----------
+        q : float
+            quantile, between 0 and 1
+        capacity : int
+            number of values retained per compaction level
+        seed : int
+            seed for choosing compaction offsets
+        """
+        if capacity < 2:
+            raise ValueError("Capacity must be at least 2")
+
+        self.q = float(q)
+        self.capacity = int(capacity)
+        self.rng = np.random.default_rng(seed)
+        self.levels = []
+        self.nans = None
+        self.squeeze = None
+
+    def _insert(self, level, values):
+        if len(self.levels) == level:
+            self.levels.append(values)
+        else:
+            self.levels[level] = np.concatenate([self.levels[level], values])
+
+    def _compact(self):
+        level = 0
+
+        while level < len(self.levels):
+            values = self.levels[level]
+
+            if len(values) > self.capacity:
+                values = np.sort(values, axis=0)
+
+                # retain a random value if the count is odd
+                if len(values) % 2:
+                    keep = self.rng.integers(len(values))
+                    self.levels[level] = values[keep : keep + 1]
+                    values = np.delete(values, keep, axis=0)
+                else:
+                    self.levels[level] = values[:0]
+
+                # promote every other value
+                offset = self.rng.integers(2)
+                self._insert(level + 1, values[offset::2])
+
+            level += 1
+
+    def update(self, x):
+        if not len(x):
+            return self
+
+        x = np.asarray(x)
+        squeeze = x.ndim == 1
+        x = x[:, None] if squeeze else x
+
+        if self.squeeze is None:
+            self.squeeze = squeeze
+            self.nans = np.zeros(x.shape[1], dtype=bool)
+
+        # nans are tracked separately, matching np.quantile
+        nans = np.isnan(x)
+        self.nans |= nans.any(axis=0)
+
+        self._insert(0, x)
+        self._compact()
+
+        return self
+
+    def merge(self, other):
+        if other.q != self.q or other.capacity != self.capacity:
+            raise ValueError("Cannot merge sketches of different quantiles or capacities")
+
+        if other.squeeze is None:
+            return self
+
+        if self.squeeze is None:
+            self.squeeze = other.squeeze
+            self.nans = np.zeros_like(other.nans)
+
+        self.nans |= other.nans
+
+        for level, values in enumerate(other.levels):
+            self._insert(level, values)
+
+        self._compact()
+
+        return self
+
+    @property
+    def value(self):
+        if self.squeeze is None:
+            return np.nan
+
+        # weighted values, level h values carry weight 2^h
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(v), 2**h) for h, v in enumerate(self.levels)])
+
+        # sorted values and weights
+        order = np.argsort(values, axis=0)
+        values = np.take_along_axis(values, order, axis=0)
+        weights = weights[order]
+
+        # rank position of each value -- the center of the ranks it represents, 0-based
+        ranks = np.cumsum(weights, axis=0) - (weights + 1) / 2
+        target = self.q * (ranks[-1] + (weights[-1] - 1) / 2)
+
+        # linear interpolation between neighboring rank positions, matching np.quantile
+        cols = np.arange(values.shape[1])
+        upper = (ranks < target).sum(axis=0).clip(1, max(len(values) - 1, 1))
+        lower = upper - 1
+
+        if len(values) > 1:
+            span = ranks[upper, cols] - ranks[lower, cols]
+            frac = np.clip((target - ranks[lower, cols]) / span, 0, 1)
+            value = values[lower, cols] + frac * (values[upper, cols] - values[lower, cols])
+        else:
+            value = values[0]
+
+        value = np.where(self.nans, np.nan, value)
+
+        return value[0] if self.squeeze else value
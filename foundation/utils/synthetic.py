@@ -0,0 +1,191 @@
+import numpy as np
+import pandas as pd
+
+
+# data streams of a trial
+STREAMS = ["stimuli", "perspectives", "modulations", "units"]
+
+
+def trial(
+    index,
+    samples=300,
+    height=144,
+    width=256,
+    channels=1,
+    perspectives=2,
+    modulations=2,
+    units=1000,
+    seed=0,
+    streams=None,
+):
+    """Generates a deterministic random trial
+
+    Parameters
+    ----------
+    index : int
+        trial index
+    samples : int
+        number of samples
+    height : int
+        stimulus height (pixels)
+    width : int
+        stimulus width (pixels)
+    channels : int
+        stimulus channels
+    perspectives : int
+        number of perspective features
+    modulations : int
+        number of modulation features
+    units : int
+        number of units
+    seed : int
+        random seed
+    streams : Sequence[str] | None
+        data streams to generate, None generates all streams
+
+    Returns
+    -------
+    dict[str, ND array]
+        stimuli -- [samples, height, width, channels] -- dtype=uint8
+        perspectives -- [samples, perspectives] -- dtype=float32
+        modulations -- [samples, modulations] -- dtype=float32
+        units -- [samples, units] -- dtype=float32
+    """
+    # independent random generator per data stream
+    rng = {k: np.random.default_rng([int(seed), int(index), i]) for i, k in enumerate(STREAMS)}
+
+    generators = {
+        "stimuli": lambda: rng["stimuli"].integers(0, 256, size=[samples, height, width, channels], dtype=np.uint8),
+        "perspectives": lambda: rng["perspectives"].standard_normal(size=[samples, perspectives], dtype=np.float32),
+        "modulations": lambda: rng["modulations"].standard_normal(size=[samples, modulations], dtype=np.float32),
+        "units": lambda: rng["units"].gamma(shape=1, size=[samples, units]).astype(np.float32),
+    }
+    return {k: generators[k]() for k in STREAMS if streams is None or k in streams}
+
+
+def generate(indexes, **kwargs):
+    """Generates deterministic random trials
+
+    Parameters
+    ----------
+    indexes : Iterable[int]
+        trial indexes
+    **kwargs
+        see `trial`
+
+    Yields
+    ------
+    dict[str, ND array]
+        see `trial`
+    """
+    for index in indexes:
+        yield trial(index, **kwargs)
+
+
+def split(trials, fraction, seed=0):
+    """
+    Parameters
+    ----------
+    trials : int
+        number of trials
+    fraction : float
+        fraction of training trials
+    seed : int
+        random seed
+
+    Returns
+    -------
+    1D array
+        [trials] -- dtype=bool -- training | validation trial
+    """
+    rng = np.random.default_rng(int(seed))
+    training = np.zeros(trials, dtype=bool)
+    training[rng.choice(trials, size=round(trials * float(fraction)), replace=False)] = True
+    return training
+
+
+def frame(trials=100, training_fraction=0.9, samples=300, lazy=0, **kwargs):
+    """Builds the trial frame of a dataset of deterministic random trials, without database access
+
+    Parameters
+    ----------
+    trials : int
+        number of trials
+    training_fraction : float
+        fraction of training trials
+    samples : int
+        number of samples per trial
+    lazy : int
+        maximum number of generated trials kept per data stream, 0 generates all trials upfront
+    **kwargs
+        see `trial`
+
+    Returns
+    -------
+    pandas.DataFrame
+        index -- trial_id
+        training -- bool
+        samples -- int
+        stimuli, perspectives, modulations, units -- trial data, see `trial`
+    """
+    from foundation.utils.lazy import TrialLoader
+    from foundation.utils.prefetch import prefetch_size
+
+    # trials
+    index = pd.Index([str(_) for _ in range(trials)], name="trial_id")
+    columns = {
+        "training": split(trials, training_fraction, seed=kwargs.get("seed", 0)),
+        "samples": np.full(trials, samples),
+    }
+
+    # trial data
+    if lazy > 0:
+
+        def loader(stream):
+            def load(trial_ids):
+                for t in generate((int(_) for _ in trial_ids), samples=samples, streams=[stream], **kwargs):
+                    yield t[stream]
+
+            # sample shape and dtype, from an empty trial
+            x = trial(0, samples=0, streams=[stream], **kwargs)[stream]
+
+            return TrialLoader(load, keys=index, shape=x.shape[1:], dtype=x.dtype, size=lazy, prefetch=prefetch_size())
+
+        data = {k: loader(k).handles(columns["samples"]) for k in STREAMS}
+
+    else:
+        from fnn.data import NpyFile
+
+        data = {k: [] for k in STREAMS}
+
+        for t in generate(range(trials), samples=samples, **kwargs):
+            for k in STREAMS:
+                data[k].append(NpyFile(t[k]))
+
+    return pd.DataFrame(dict(columns, **data), index=index)
+
+
+def dataset(trials=100, training_fraction=0.9, samples=300, lazy=0, **kwargs):
+    """Builds a dataset of deterministic random trials, without database access
+
+    Parameters
+    ----------
+    trials : int
+        number of trials
+    training_fraction : float
+        fraction of training trials
+    samples : int
+        number of samples per trial
+    lazy : int
+        maximum number of generated trials kept per data stream, 0 generates all trials upfront
+    **kwargs
+        see `trial`
+
+    Returns
+    -------
+    fnn.data.Dataset
+        network dataset
+    """
+    from fnn.data import Dataset
+
+    return Dataset(frame(trials=trials, training_fraction=training_fraction, samples=samples, lazy=lazy, **kwargs))
@@ -228,3 +228,42 @@ class Video:
                 yield np.array(self.frames[i])
             else:
                 yield self.frames[i]
+
+
+def array_info(array, mode=None):
+    """Video attributes of a frame array, without constructing the frames of the video
+
+    Parameters
+    ----------
+    array: 3D array | 4D array
+        [frames, height, width] | [frames, height, width, channels]
+    mode : None | str
+        frame mode
+
+    Returns
+    -------
+    int
+        number of frames
+    int
+        frame height
+    int
+        frame width
+    int
+        frame channels
+    str
+        frame mode
+    """
+    if array.ndim == 4:
+        array = array.squeeze(3)
+    elif array.ndim != 3:
+        raise ValueError("Array must be either 4D or 3D")
+
+    frames, height, width = array.shape
+    mode = Frame.fromarray(array[0], mode=mode).mode
+
+    if mode == "L":
+        channels = 1
+    else:
+        raise NotImplementedError(f"Mode {mode} has not yet been implemented.")
+
+    return frames, height, width, channels, mode
@@ -1,4 +1,5 @@
 import datajoint as dj
+from collections.abc import Mapping
 
 pipe_exp = dj.create_virtual_module("pipe_exp", "pipeline_experiment")
 pipe_shared = dj.create_virtual_module("pipe_shared", "pipeline_shared")
@@ -14,19 +15,73 @@ pipe_rdk = dj.create_virtual_module("pipe_rdk", "pipeline_rdk")
 pipe_netflix = dj.create_virtual_module("pipe_netflix", "pipeline_netflix")
 
 
+_scan_pipes = dict()
+_scan_misses = set()
+
+
+def _load_scan_pipes():
+    """Bulk loads the rows of pipe_fuse.ScanDone into the per-process index"""
+    rows = pipe_fuse.ScanDone.fetch(as_dict=True)
+    pipes = dict()
+
+    for row in rows:
+        scan = (row["animal_id"], row["session"], row["scan_idx"])
+        pipes.setdefault(scan, []).append(row)
+
+    _scan_pipes.clear()
+    _scan_pipes.update(pipes)
+    _scan_misses.clear()
+
+
+def _index_pipe(key):
+    """
+    Parameters
+    ----------
+    key : Mapping
+        restriction containing a scan
+
+    Returns
+    -------
+    str | None
+        pipe of the rows of the index that match the key, None if the index does not resolve a unique pipe
+    """
+    scan = (key["animal_id"], key["session"], key["scan_idx"])
+
+    # refresh index on the first miss of a scan, later misses are resolved by query
+    if scan not in _scan_pipes and scan not in _scan_misses:
+        _load_scan_pipes()
+
+        if scan not in _scan_pipes:
+            _scan_misses.add(scan)
+            return
+
+    # rows that match the key on all shared attributes
+    rows = _scan_pipes.get(scan, [])
+    pipes = {row["pipe"] for row in rows if all(row[k] == key[k] for k in row.keys() & key.keys())}
+
+    if len(pipes) == 1:
+        return pipes.pop()
+
+
 def resolve_pipe(key):
     """
     Parameters
     ----------
     key
-        restriction for pipe_fuse.ScanDone
+        restriction for pipe_fuse.ScanDone -- dict keys containing a scan are resolved by the per-process index
 
     Returns
     -------
         pipe_meso | pipe_reso
     """
-    pipe = dj.U("pipe") & (pipe_fuse.ScanDone & key)
-    pipe = pipe.fetch1("pipe")
+    pipe = None
+
+    if isinstance(key, Mapping) and {"animal_id", "session", "scan_idx"} <= key.keys():
+        pipe = _index_pipe(key)
+
+    if pipe is None:
+        pipe = dj.U("pipe") & (pipe_fuse.ScanDone & key)
+        pipe = pipe.fetch1("pipe")
 
     if pipe == "meso":
         return pipe_meso
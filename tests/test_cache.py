@@ -0,0 +1,65 @@
+import os
+import numpy as np
+import pandas as pd
+from foundation.utils.cache import DatasetCache, use_dataset_cache, dataset_cache
+from foundation.utils.cache import use_shared_dataset_cache, shared_dataset_cache
+
+
+def test_write_read(tmp_path):
+    cache = DatasetCache(str(tmp_path), name="data")
+    assert not cache.exists
+
+    index = pd.Index(["3", "1", "2"], name="trial_id")
+    columns = {"training": np.array([True, False, True]), "samples": np.array([4, 5, 6])}
+    streams = {"units": (np.full([n, 2], n, dtype=np.float32) for n in [4, 5, 6])}
+
+    with cache.lock():
+        cache.write(index, columns, streams)
+
+    assert cache.exists
+
+    data = cache.read()
+    assert data.index.name == "trial_id"
+    assert list(data.index) == ["3", "1", "2"]
+    assert data["training"].dtype == bool
+    assert data["samples"].dtype == np.int64
+    assert [u.shape for u in data["units"]] == [(4, 2), (5, 2), (6, 2)]
+    assert all(isinstance(u, np.memmap) for u in data["units"])
+
+
+def test_index_dtype(tmp_path):
+    cache = DatasetCache(str(tmp_path), name="data")
+    cache.write(pd.Index([10, 20], name="i"), {"samples": [1, 1]}, {"x": [np.zeros(1), np.ones(1)]})
+
+    assert cache.read().index.dtype == np.int64
+    assert list(cache.read().index) == [10, 20]
+
+
+def test_use_dataset_cache(tmp_path):
+    assert dataset_cache() is None
+
+    with use_dataset_cache(str(tmp_path)):
+        assert dataset_cache() == str(tmp_path)
+
+    assert dataset_cache() is None
+
+
+def test_shared_dataset_cache(tmp_path):
+    assert dataset_cache() is None
+
+    # disabled by default
+    with shared_dataset_cache() as root:
+        assert root is None
+
+    # temporary cache, removed on exit
+    with use_shared_dataset_cache():
+        with shared_dataset_cache() as root:
+            assert dataset_cache() == root
+            assert os.path.isdir(root)
+
+    assert not os.path.exists(root)
+    assert dataset_cache() is None
+
+    # explicit cache directory
+    with use_dataset_cache(str(tmp_path)), shared_dataset_cache() as root:
+        assert root == str(tmp_path)
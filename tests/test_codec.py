@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from foundation.utils.codec import encode, decode, quantize, dequantize
+
+
+@pytest.fixture
+def x():
+    x = np.random.default_rng(0).normal(size=[300, 5]).astype(np.float32)
+    x[:, 4] = 1.5
+    return x
+
+
+def test_identity(x):
+    assert encode(x) is x
+    assert decode(x) is x
+
+
+@pytest.mark.parametrize("codec, tolerance", [(None, 0), ("float16", 1e-2), ("uint16", 1e-3), ("uint8", 5e-2)])
+def test_round_trip(x, codec, tolerance):
+    y = decode(encode(x, codec))
+
+    assert y.dtype == np.float32
+    assert y.shape == x.shape
+    assert np.abs(y - x).max() <= tolerance * np.abs(x).max()
+
+
+@pytest.mark.parametrize("codec", ["uint8", "uint16"])
+def test_quantize_nans(x, codec):
+    x[3, 1] = np.nan
+    x[:, 2] = np.nan
+
+    data, params = quantize(x, codec)
+    y = dequantize(data, codec, **params)
+
+    assert np.array_equal(np.isnan(y), np.isnan(x))
+    assert np.allclose(y[:, 0], x[:, 0], atol=params["scale"][0])
+
+
+@pytest.mark.parametrize("compression", ["zstd", "blosc"])
+def test_compression(x, compression):
+    pytest.importorskip(compression)
+
+    assert np.array_equal(decode(encode(x, compression=compression)), x)
+
+
+def test_decode_out(x):
+    out = np.empty_like(x)
+
+    assert decode(encode(x, "float16"), out=out) is out
+    assert decode(x, out=out) is out
+    assert np.array_equal(out, x)
+
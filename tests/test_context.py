@@ -0,0 +1,26 @@
+import os
+from foundation.utils.context import use_environ, use_processes, worker_processes
+
+
+def test_use_environ():
+    name = "FOUNDATION_TEST_ENVIRON"
+    assert name not in os.environ
+
+    with use_environ(name, 1):
+        assert os.environ[name] == "1"
+
+        with use_environ(name, "a"):
+            assert os.environ[name] == "a"
+
+        assert os.environ[name] == "1"
+
+    assert name not in os.environ
+
+
+def test_use_processes():
+    assert worker_processes() == 1
+
+    with use_processes(4):
+        assert worker_processes() == 4
+
+    assert worker_processes() == 1
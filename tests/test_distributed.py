@@ -0,0 +1,22 @@
+import os
+from foundation.utils.distributed import use_rendezvous, rendezvous_timeout, rendezvous
+
+
+def test_rendezvous():
+    with rendezvous() as a, rendezvous() as b:
+        assert a.startswith("file://")
+        assert a != b
+
+        path = os.path.dirname(a[len("file://") :])
+        assert os.path.isdir(path)
+
+    assert not os.path.exists(path)
+
+
+def test_use_rendezvous():
+    assert rendezvous_timeout() == 1800
+
+    with use_rendezvous(60):
+        assert rendezvous_timeout() == 60
+
+    assert rendezvous_timeout() == 1800
@@ -0,0 +1,106 @@
+import time
+import numpy as np
+from foundation.utils.lazy import TrialLoader, use_lazy_dataset, lazy_size
+
+
+def loader(size=4, prefetch=0):
+    calls = []
+
+    def load(keys):
+        calls.append(list(keys))
+        for key in keys:
+            yield np.full([3, 2], key, dtype=np.float32)
+
+    return TrialLoader(load, keys=range(20), shape=[2], dtype=np.float32, size=size, prefetch=prefetch), calls
+
+
+def wait(loader, timeout=5):
+    start = time.perf_counter()
+    while loader._pending and time.perf_counter() - start < timeout:
+        time.sleep(0.01)
+
+
+def test_handles():
+    trials, calls = loader()
+    handles = trials.handles([3] * len(trials))
+
+    # metadata without loading
+    assert handles[5].shape == (3, 2)
+    assert handles[5].dtype == np.float32
+    assert len(handles[5]) == 3
+    assert not calls
+
+    assert np.array_equal(np.asarray(handles[5]), np.full([3, 2], 5))
+    assert handles[5][1, 0] == 5
+    assert calls == [[5]]
+
+
+def test_lru():
+    trials, calls = loader(size=2)
+
+    for i in [0, 1, 0, 2, 0, 1]:
+        assert trials[i][0, 0] == i
+
+    # 1 is evicted by 2, 0 is kept as the most recently used
+    assert calls == [[0], [1], [2], [1]]
+    assert len(trials._trials) == 2
+
+
+def test_schedule():
+    trials, calls = loader(size=8, prefetch=4)
+    order = [7, 3, 11, 2, 9, 15, 3, 0]
+
+    trials.schedule(order)
+    wait(trials)
+
+    # the first scheduled trials are loaded in a single call
+    assert calls == [[7, 3, 11, 2]]
+
+    for i in order:
+        assert trials[i][0, 0] == i
+        wait(trials)
+
+    # every trial is loaded once, ahead of its request
+    assert sorted(sum(calls, [])) == sorted(set(order))
+
+
+def test_no_schedule():
+    trials, calls = loader(size=8, prefetch=4)
+
+    trials[0]
+    wait(trials)
+
+    # without a schedule, the trials that follow the requested trial are prefetched
+    assert calls == [[0], [1, 2, 3, 4]]
+
+    trials[1]
+    wait(trials)
+
+    assert calls == [[0], [1, 2, 3, 4], [5]]
+
+
+def test_dataset():
+    from foundation.utils.prefetch import use_prefetch
+    from foundation.utils.synthetic import frame, trial
+
+    with use_prefetch(2):
+        df = frame(trials=10, samples=5, lazy=4, units=3, height=4, width=6)
+
+    units = df["units"]
+    loader = units.iloc[0].loader
+
+    # trials are loaded on access, and the following trials are prefetched
+    assert not loader._trials
+    assert np.array_equal(np.asarray(units.iloc[3]), trial(3, samples=5, units=3, height=4, width=6)["units"])
+
+    wait(loader)
+    assert sorted(loader._trials) == [3, 4, 5]
+
+
+def test_use_lazy_dataset():
+    assert lazy_size() == 0
+
+    with use_lazy_dataset(16):
+        assert lazy_size() == 16
+
+    assert lazy_size() == 0
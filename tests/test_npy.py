@@ -0,0 +1,40 @@
+import os
+import numpy as np
+import pytest
+from foundation.utils.npy import save, create, load
+
+
+def test_save_load(tmp_path):
+    path = str(tmp_path / "a" / "x.npy")
+    x = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    save(path, x)
+    save(path, x + 1)
+
+    y = load(path)
+    assert isinstance(y, np.memmap)
+    assert np.array_equal(y, x + 1)
+    assert np.array_equal(load(path, mmap=False), x + 1)
+    assert os.listdir(tmp_path / "a") == ["x.npy"]
+
+
+def test_create(tmp_path):
+    path = str(tmp_path / "x.npy")
+
+    with create(path, shape=[4, 2], dtype=np.uint8) as x:
+        x[:] = 7
+        assert not os.path.exists(path)
+
+    y = load(path)
+    assert y.dtype == np.uint8
+    assert np.array_equal(y, np.full([4, 2], 7))
+
+
+def test_create_error(tmp_path):
+    path = str(tmp_path / "x.npy")
+
+    with pytest.raises(RuntimeError):
+        with create(path, shape=[2]):
+            raise RuntimeError
+
+    assert os.listdir(tmp_path) == []
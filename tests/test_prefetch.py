@@ -0,0 +1,44 @@
+import pytest
+from foundation.utils.prefetch import prefetch, use_prefetch, prefetch_size
+
+
+def test_order():
+    assert list(prefetch(range(100), size=3)) == list(range(100))
+    assert list(prefetch([], size=3)) == []
+
+
+def test_error():
+    def items():
+        yield 1
+        raise KeyError("item")
+
+    it = prefetch(items(), size=2)
+
+    assert next(it) == 1
+    with pytest.raises(KeyError):
+        next(it)
+
+
+def test_close():
+    consumed = []
+
+    def items():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    it = prefetch(items(), size=2)
+    assert next(it) == 0
+    it.close()
+
+    # the worker stops shortly after the consumer
+    assert len(consumed) < 10
+
+
+def test_use_prefetch():
+    assert prefetch_size() == 0
+
+    with use_prefetch(4):
+        assert prefetch_size() == 4
+
+    assert prefetch_size() == 0
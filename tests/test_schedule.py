@@ -0,0 +1,47 @@
+import sys
+import time
+import pytest
+from foundation.utils.schedule import Job, pack
+
+
+def test_pack_exit_codes():
+    jobs = [
+        Job("a", sys.exit, args=[0]),
+        Job("b", sys.exit, args=[3]),
+        Job("c", time.sleep, args=[0.1]),
+    ]
+    codes = pack(jobs, cores=2, memory=1, poll=0.05)
+
+    assert list(codes) == ["a", "b", "c"]
+    assert codes == {"a": 0, "b": 3, "c": 0}
+
+
+def test_pack_budget():
+    jobs = [Job("a", time.sleep, args=[0.2], cores=1), Job("b", time.sleep, args=[0.2], cores=1)]
+
+    start = time.perf_counter()
+    pack(jobs, cores=1, memory=1, poll=0.05)
+    serial = time.perf_counter() - start
+
+    # jobs that do not fit together run one after the other
+    assert serial >= 0.4
+
+    with pytest.raises(ValueError):
+        pack([Job("a", time.sleep, args=[0], memory=2)], cores=1, memory=1)
+
+    with pytest.raises(ValueError):
+        pack([Job("a", time.sleep, args=[0], devices=1)], cores=1, memory=1, devices=[])
+
+
+def test_pack_logs(tmp_path):
+    jobs = [Job("a", print, args=["hello"]), Job("b", print, args=["world"])]
+    codes = pack(jobs, cores=2, memory=1, log_dir=str(tmp_path), poll=0.05)
+
+    assert codes == {"a": 0, "b": 0}
+    assert (tmp_path / "a.log").read_text().strip() == "hello"
+    assert (tmp_path / "b.log").read_text().strip() == "world"
+
+
+def test_pack_names():
+    with pytest.raises(AssertionError):
+        pack([Job("a", time.sleep, args=[0]), Job("a", time.sleep, args=[0])], cores=1, memory=1)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from foundation.utils.stat import Minimum, Mean, Std, Quantile, QuantileSketch
+
+
+def chunks(x, sizes=(1, 7, 100, 0, 892)):
+    bounds = np.cumsum([0, *sizes])
+    return [x[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+@pytest.fixture
+def x():
+    return np.random.default_rng(0).normal(loc=3, scale=2, size=[1000, 4])
+
+
+def test_minimum_mean(x):
+    minimum, mean = Minimum(), Mean()
+    for c in chunks(x):
+        minimum.update(c)
+        mean.update(c)
+
+    assert np.allclose(minimum.value, x.min(axis=0))
+    assert np.allclose(mean.value, x.mean(axis=0))
+    assert np.isnan(Mean().value) and np.isnan(Minimum().value)
+
+
+@pytest.mark.parametrize("ddof", [0, 1])
+def test_std(x, ddof):
+    std = Std(ddof=ddof)
+    for c in chunks(x):
+        std.update(c)
+
+    assert np.allclose(std.value, np.std(x, axis=0, ddof=ddof))
+
+
+def test_std_merge(x):
+    a, b = Std(ddof=1).update(x[:300]), Std(ddof=1).update(x[300:])
+
+    assert np.allclose(a.merge(b).value, np.std(x, axis=0, ddof=1))
+
+    with pytest.raises(ValueError):
+        Std(ddof=0).merge(Std(ddof=1))
+
+
+def test_quantile(x):
+    a, b = Quantile(0.25).update(x[:500]), Quantile(0.25).update(x[500:])
+
+    assert np.allclose(a.merge(b).value, np.quantile(x, 0.25, axis=0))
+
+
+@pytest.mark.parametrize("q", [0, 0.1, 0.5, 0.9, 1])
+def test_quantile_sketch_rank_error(q):
+    x = np.random.default_rng(1).standard_normal([100_000, 2])
+
+    sketch = QuantileSketch(q, capacity=256)
+    for c in np.array_split(x, 37):
+        sketch.update(c)
+
+    # rank of the estimate within the values
+    rank = (x < sketch.value).mean(axis=0)
+    assert np.abs(rank - q).max() < 0.02
+
+    # memory is bounded
+    assert sum(map(len, sketch.levels)) < 256 * 16
+
+
+def test_quantile_sketch_exact():
+    x = np.random.default_rng(2).standard_normal(200)
+
+    # without compaction, the sketch matches np.quantile
+    for q in [0, 0.3, 0.5, 1]:
+        assert np.isclose(QuantileSketch(q, capacity=256).update(x).value, np.quantile(x, q))
+
+
+def test_quantile_sketch_merge_nans():
+    x = np.random.default_rng(3).standard_normal([5000, 2])
+    x[10, 1] = np.nan
+
+    a = QuantileSketch(0.5).update(x[:2500])
+    b = QuantileSketch(0.5).update(x[2500:])
+    value = a.merge(b).value
+
+    assert np.isnan(value[1])
+    assert abs((x[:, 0] < value[0]).mean() - 0.5) < 0.02
+
+    with pytest.raises(ValueError):
+        QuantileSketch(0.5).merge(QuantileSketch(0.4))
@@ -0,0 +1,33 @@
+import numpy as np
+from foundation.utils.synthetic import STREAMS, trial, split
+
+
+def test_trial():
+    t = trial(3, samples=10, height=4, width=6, channels=1, perspectives=2, modulations=3, units=5)
+
+    assert list(t) == STREAMS
+    assert t["stimuli"].shape == (10, 4, 6, 1) and t["stimuli"].dtype == np.uint8
+    assert t["perspectives"].shape == (10, 2) and t["perspectives"].dtype == np.float32
+    assert t["modulations"].shape == (10, 3) and t["modulations"].dtype == np.float32
+    assert t["units"].shape == (10, 5) and t["units"].dtype == np.float32
+
+
+def test_trial_deterministic():
+    kwargs = dict(samples=10, height=4, width=6, units=5)
+
+    a = trial(3, **kwargs)
+    b = trial(3, streams=["units"], **kwargs)
+    c = trial(4, **kwargs)
+
+    # streams are independent of each other and of the other trials
+    assert list(b) == ["units"]
+    assert np.array_equal(a["units"], b["units"])
+    assert not np.array_equal(a["units"], c["units"])
+
+
+def test_split():
+    training = split(100, 0.9, seed=1)
+
+    assert training.dtype == bool
+    assert training.sum() == 90
+    assert np.array_equal(training, split(100, 0.9, seed=1))